@@ -1,98 +1,65 @@
 # -*- coding: utf-8 -*-
-"""
-AgentScope Extension for Nacos - Deep integration between AgentScope and Nacos
-
-This library provides seamless integration of AgentScope with Nacos, supporting:
-- Dynamic Agent configuration management (Prompt, MCP Server, Chat Model)
-- Nacos service discovery and registration
-- MCP (Model Context Protocol) clients
-- A2A (Agent-to-Agent) protocol support
-
-Core Components:
-- NacosServiceManager: Nacos service connection pool manager (Singleton pattern)
-- NacosAgentListener: Agent configuration listener with Nacos integration
-- NacosReActAgent: ReAct Agent integrated with Nacos configuration
+"""AgentScope Extension for Nacos - see README.md for usage and configuration.
 
-Submodules:
-- mcp: MCP protocol clients and dynamic toolkit
-- model: Dynamically configured chat models
-- a2a: A2A protocol agents and adapters
-
-Usage Examples:
-    >>> from agentscope_extension_nacos import (
-    ...     NacosServiceManager,
-    ...     NacosAgentListener,
-    ...     NacosReActAgent,
-    ... )
-    >>> 
-    >>> # Method 1: Using environment variables
-    >>> listener = NacosAgentListener(agent_name="my_agent")
-    >>> await listener.initialize()
-    >>> agent = NacosReActAgent(nacos_agent_listener=listener, name="my_agent")
-    >>> 
-    >>> # Method 2: Manually create nacos_client_config
-    >>> from v2.nacos import ClientConfigBuilder
-    >>> config = (ClientConfigBuilder()
-    ...     .server_address("localhost:8848")
-    ...     .namespace_id("public")
-    ...     .username("nacos")
-    ...     .password("nacos")
-    ...     .build())
-    >>> listener = NacosAgentListener(
-    ...     agent_name="my_agent",
-    ...     nacos_client_config=config,  # Pass custom config
-    ... )
-    >>> await listener.initialize()
-    >>> 
-    >>> # Method 3: Set global config (affects all components)
-    >>> NacosServiceManager.set_global_config(config)
-
-Environment Variables:
-    NACOS_SERVER_ADDRESS=localhost:8848   # Required
-    NACOS_NAMESPACE_ID=public             # Required
-    NACOS_ACCESS_KEY=xxx                  # Optional (Alibaba Cloud MSE)
-    NACOS_SECRET_KEY=yyy                  # Optional (Alibaba Cloud MSE)
-    NACOS_USERNAME=nacos                  # Optional (Local Nacos)
-    NACOS_PASSWORD=nacos                  # Optional (Local Nacos)
+AsyncRWLock is no longer part of the public API; import it from
+``agentscope_extension_nacos.utils`` if needed.
 """
 
 __version__ = "0.2.1"
 __author__ = "AgentScope Extension Team"
 
-# =============================================================================
-# Core Components - Nacos Service Manager
-# =============================================================================
-from agentscope_extension_nacos.nacos_service_manager import (
-    NacosServiceManager,
-    # Convenience functions
-    get_nacos_naming_service,
-    get_nacos_config_service,
-    get_nacos_ai_service,
-)
+import importlib
 
 # =============================================================================
-# Core Components - Agent Listener and ReAct Agent
+# Lazy Imports
 # =============================================================================
-from agentscope_extension_nacos.nacos_react_agent import (
-    NacosAgentListener,
-    NacosReActAgent,
-)
+# Public names are resolved on first attribute access (PEP 562), so that
+# ``import agentscope_extension_nacos`` does not pull in the Nacos SDK,
+# AgentScope, MCP and A2A stacks until they are actually used.
+_LAZY_IMPORTS = {
+    # Service Manager
+    "NacosServiceManager": "agentscope_extension_nacos.nacos_service_manager",
+    "get_nacos_naming_service": "agentscope_extension_nacos.nacos_service_manager",
+    "get_nacos_config_service": "agentscope_extension_nacos.nacos_service_manager",
+    "get_nacos_ai_service": "agentscope_extension_nacos.nacos_service_manager",
+    # Agent Components
+    "NacosAgentListener": "agentscope_extension_nacos.nacos_react_agent",
+    "NacosReActAgent": "agentscope_extension_nacos.nacos_react_agent",
+    # Utilities
+    # Deprecated, not part of __all__; kept resolvable for old imports
+    "AsyncRWLock": "agentscope_extension_nacos.utils",
+    "validate_agent_name": "agentscope_extension_nacos.utils",
+    "get_first_non_loopback_ip": "agentscope_extension_nacos.utils",
+    "generate_url_from_endpoint": "agentscope_extension_nacos.utils",
+    "random_generate_url_from_mcp_server_detail_info": "agentscope_extension_nacos.utils",
+}
+
+
+# Subpackages, importable as attributes of the package
+_SUBMODULES = ("a2a", "mcp", "model")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # Importing a subpackage binds it on this module as a side effect
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _ALL_SET | set(_SUBMODULES))
 
-# =============================================================================
-# Utilities
-# =============================================================================
-from agentscope_extension_nacos.utils import (
-    AsyncRWLock,
-    validate_agent_name,
-    get_first_non_loopback_ip,
-    generate_url_from_endpoint,
-    random_generate_url_from_mcp_server_detail_info,
-)
 
 # =============================================================================
 # Public API
 # =============================================================================
-__all__ = [
+__all__ = (
     # Version info
     "__version__",
     "__author__",
@@ -105,9 +72,11 @@ __all__ = [
     "NacosAgentListener",
     "NacosReActAgent",
     # Utilities
-    "AsyncRWLock",
     "validate_agent_name",
     "get_first_non_loopback_ip",
     "generate_url_from_endpoint",
     "random_generate_url_from_mcp_server_detail_info",
-]
+)
+
+# Membership set for __dir__, built once
+_ALL_SET = frozenset(__all__)
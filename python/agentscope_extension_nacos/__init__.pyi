@@ -0,0 +1,37 @@
+from agentscope_extension_nacos import a2a as a2a
+from agentscope_extension_nacos import mcp as mcp
+from agentscope_extension_nacos import model as model
+from agentscope_extension_nacos.nacos_react_agent import (
+    NacosAgentListener as NacosAgentListener,
+    NacosReActAgent as NacosReActAgent,
+)
+from agentscope_extension_nacos.nacos_service_manager import (
+    NacosServiceManager as NacosServiceManager,
+    get_nacos_ai_service as get_nacos_ai_service,
+    get_nacos_config_service as get_nacos_config_service,
+    get_nacos_naming_service as get_nacos_naming_service,
+)
+from agentscope_extension_nacos.utils import (
+    generate_url_from_endpoint as generate_url_from_endpoint,
+    get_first_non_loopback_ip as get_first_non_loopback_ip,
+    random_generate_url_from_mcp_server_detail_info as random_generate_url_from_mcp_server_detail_info,
+    validate_agent_name as validate_agent_name,
+)
+
+__version__: str
+__author__: str
+
+__all__ = (
+    "__version__",
+    "__author__",
+    "NacosServiceManager",
+    "get_nacos_naming_service",
+    "get_nacos_config_service",
+    "get_nacos_ai_service",
+    "NacosAgentListener",
+    "NacosReActAgent",
+    "validate_agent_name",
+    "get_first_non_loopback_ip",
+    "generate_url_from_endpoint",
+    "random_generate_url_from_mcp_server_detail_info",
+)
@@ -34,16 +34,54 @@ Usage Examples:
     >>> agent = A2aAgent(agent_card_source=None, agent_card_resolver=resolver)
 """
 
-from agentscope_extension_nacos.a2a.a2a_agent import (
-    A2ACardResolverBase,
-    DefaultA2ACardResolver,
-    A2aAgent,
-)
+import importlib
+
+# Public names are resolved on first attribute access (PEP 562), mapping
+# each name to the module and attribute that provide it.
+_LAZY_IMPORTS = {
+    "A2ACardResolverBase": (
+        "agentscope_extension_nacos.a2a.a2a_card_resolver",
+        "AgentCardResolverBase",
+    ),
+    "DefaultA2ACardResolver": (
+        "agentscope_extension_nacos.a2a.a2a_card_resolver",
+        "DefaultA2ACardResolver",
+    ),
+    "A2aAgent": (
+        "agentscope_extension_nacos.a2a.a2a_agent",
+        "A2aAgent",
+    ),
+    "set_shared_httpx_client": (
+        "agentscope_extension_nacos.a2a._http",
+        "set_shared_httpx_client",
+    ),
+}
+
+
+def __getattr__(name):
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target
+    value = getattr(importlib.import_module(module_name), attr_name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
-__all__ = [
+def __dir__():
+    return sorted(set(globals()) | _ALL_SET)
+
+
+__all__ = (
     # Base classes and resolvers
     "A2ACardResolverBase",
     "DefaultA2ACardResolver",
     # Agent
     "A2aAgent",
-]
+    # HTTP client sharing
+    "set_shared_httpx_client",
+)
+
+# Membership set for __dir__, built once
+_ALL_SET = frozenset(__all__)
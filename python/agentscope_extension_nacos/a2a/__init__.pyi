@@ -0,0 +1,15 @@
+from agentscope_extension_nacos.a2a._http import (
+    set_shared_httpx_client as set_shared_httpx_client,
+)
+from agentscope_extension_nacos.a2a.a2a_agent import A2aAgent as A2aAgent
+from agentscope_extension_nacos.a2a.a2a_card_resolver import (
+    AgentCardResolverBase as A2ACardResolverBase,
+    DefaultA2ACardResolver as DefaultA2ACardResolver,
+)
+
+__all__ = (
+    "A2ACardResolverBase",
+    "DefaultA2ACardResolver",
+    "A2aAgent",
+    "set_shared_httpx_client",
+)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP client for A2A calls.
+
+Agents and card resolvers that are not given an explicit ``httpx`` client
+share one pooled client per event loop, so connections to the same remote
+agent are kept alive and reused across instances.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from importlib.util import find_spec
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Sized for many concurrent replies to the same remote agent
+_DEFAULT_HTTPX_LIMITS = httpx.Limits(
+	max_keepalive_connections=64,
+	max_connections=256,
+	keepalive_expiry=30.0,
+)
+
+# One client per event loop, since an httpx client cannot be used across
+# loops; entries go away with their loop
+_shared_clients: weakref.WeakKeyDictionary[
+	asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def create_httpx_client(
+		limits: httpx.Limits | None = None,
+		http2: bool | None = None,
+) -> httpx.AsyncClient:
+	"""Create a pooled HTTP client for A2A calls.
+
+	Args:
+			limits (`httpx.Limits | None`, optional):
+					Connection pool limits. Defaults to 64 keep-alive and
+					256 total connections.
+			http2 (`bool | None`, optional):
+					Whether to use HTTP/2. None enables it when the `h2`
+					package is installed.
+
+	Returns:
+			`httpx.AsyncClient`:
+					The new client; the caller owns it.
+	"""
+	return httpx.AsyncClient(
+			timeout=httpx.Timeout(timeout=600),
+			limits=limits or _DEFAULT_HTTPX_LIMITS,
+			http2=_HTTP2_AVAILABLE if http2 is None else http2,
+	)
+
+
+def get_shared_httpx_client() -> httpx.AsyncClient:
+	"""Get the shared HTTP client of the running event loop.
+
+	The client is created on first use, and again if it was closed.
+
+	Returns:
+			`httpx.AsyncClient`:
+					The shared client.
+	"""
+	loop = asyncio.get_running_loop()
+	client = _shared_clients.get(loop)
+	if client is None or client.is_closed:
+		client = create_httpx_client()
+		_shared_clients[loop] = client
+		logger.debug("Created shared A2A HTTP client for loop %s", id(loop))
+	return client
+
+
+def set_shared_httpx_client(client: httpx.AsyncClient) -> None:
+	"""Use the given client as the shared client of the running event loop.
+
+	Meant for applications that manage the client lifecycle themselves,
+	e.g. in a FastAPI lifespan handler; such applications should
+	``await client.aclose()`` on shutdown.
+
+	Args:
+			client (`httpx.AsyncClient`):
+					The client to share.
+	"""
+	_shared_clients[asyncio.get_running_loop()] = client
+
+
+async def aclose_shared_httpx_client() -> None:
+	"""Close the shared HTTP client of the running event loop, if any."""
+	client = _shared_clients.pop(asyncio.get_running_loop(), None)
+	if client is not None:
+		await client.aclose()
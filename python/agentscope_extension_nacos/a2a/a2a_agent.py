@@ -1,35 +1,148 @@
 import asyncio
-import dataclasses
+import functools
 import json
 import logging
-from abc import abstractmethod
-from pathlib import Path
-from typing import Any, Optional, Type, Union, Callable
+import time
+from itertools import chain
+from typing import (
+	AsyncIterator, Callable, Iterable, Literal, Type, TypeVar, Union, cast,
+)
 from urllib.parse import urlparse
-from uuid import uuid4
+from secrets import token_hex
 
 import httpx
 from dataclasses import dataclass, field
 
-from a2a.client import Consumer
+from a2a.client import Client, ClientConfig, Consumer
 from a2a.client.client_factory import TransportProducer, ClientFactory
 from a2a.types import (
 	AgentCard,
+	DataPart,
+	FilePart,
+	FileWithBytes,
+	FileWithUri,
 	Message as A2AMessage,
-	Part, TransportProtocol, PushNotificationConfig,
+	Part, Task, TaskArtifactUpdateEvent, TaskState, TextPart,
+	TransportProtocol,
+	PushNotificationConfig,
+	Role as A2ARole,
 )
 from agentscope.agent import AgentBase
-from agentscope.message import Msg
+from agentscope.message import (
+	AudioBlock,
+	Base64Source,
+	ContentBlock,
+	ImageBlock,
+	Msg,
+	TextBlock,
+	ThinkingBlock,
+	ToolResultBlock,
+	ToolUseBlock,
+	URLSource,
+	VideoBlock,
+)
 from grpc import Channel
 from pydantic import BaseModel
 
+from agentscope_extension_nacos.a2a._http import (
+	aclose_shared_httpx_client,
+	create_httpx_client,
+	get_shared_httpx_client,
+)
 from agentscope_extension_nacos.a2a.a2a_card_resolver import \
 	AgentCardResolverBase, FixedAgentCardResolver
 
+try:
+	import orjson
+except ImportError:  # optional speedup
+	orjson = None
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _is_absolute_url(url: str) -> bool:
+	"""Whether ``url`` has both a scheme and a network location.
+
+	Cached because the same card URL is re-validated on every refresh.
+	"""
+	parsed_url = urlparse(url)
+	return bool(parsed_url.scheme and parsed_url.netloc)
+
+
+_A2A_ROLE_TO_MSG_ROLE: dict[A2ARole, Literal["user", "assistant"]] = {
+	A2ARole.agent: "assistant",
+	A2ARole.user: "user",
+}
+"""A2A message role -> AgentScope Msg role."""
+
+# Keys under which AgentScope details travel in A2A part metadata (and, for
+# tool output, in DataPart.data) so that Msgs can be rebuilt on the other end
+_META_BLOCK_TYPE = "_agentscope_block_type"
+_META_MSG_ID = "_agentscope_msg_id"
+_META_MSG_SOURCE = "_agentscope_msg_source"
+_META_TOOL_NAME = "_agentscope_tool_name"
+_META_TOOL_CALL_ID = "_agentscope_tool_call_id"
+_DATA_TOOL_OUTPUT = "_agentscope_tool_output"
+
+_GENERIC_MIME_TYPES = {
+	"image": "image/*",
+	"audio": "audio/*",
+	"video": "video/*",
+}
+"""Media block type -> MIME type used when the block does not name one."""
+
+
+def _dumps_indented(data: object) -> str:
+	"""Serialize ``data`` as 2-space indented JSON, keeping non-ASCII text.
+
+	Uses orjson when available, since the stdlib only uses its C encoder
+	without ``indent``.
+	"""
+	if orjson is not None:
+		try:
+			return orjson.dumps(
+					data,
+					option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+			).decode()
+		except TypeError:
+			# e.g. integers beyond 64 bits; the stdlib handles them
+			pass
+	return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+_T = TypeVar("_T")
+
+
+async def _iter_with_idle_timeout(
+		items: AsyncIterator[_T],
+		timeout: float | None,
+) -> AsyncIterator[_T]:
+	"""Yield from ``items``, failing if the next item takes too long.
+
+	Raises:
+			`RuntimeError`:
+					If no item arrives within ``timeout`` seconds. The
+					source iterator is closed so its connection is released.
+	"""
+	try:
+		while True:
+			try:
+				item = await asyncio.wait_for(items.__anext__(), timeout)
+			except StopAsyncIteration:
+				return
+			except asyncio.TimeoutError as e:
+				raise RuntimeError(
+						f"Remote A2A agent idle for more than {timeout}s",
+				) from e
+			yield item
+	finally:
+		aclose = getattr(items, "aclose", None)
+		if aclose is not None:
+			await aclose()
+
+
 @dataclass
 class A2aAgentConfig:
 	"""Configuration for A2A agent client.
@@ -48,7 +161,17 @@ class A2aAgentConfig:
 	and if not, run a polling loop."""
 
 	httpx_client: httpx.AsyncClient | None = None
-	"""HTTP client to use for connecting to the agent."""
+	"""HTTP client to use for connecting to the agent. If None, a client
+	shared by all A2aAgent instances on the same event loop is used."""
+
+	httpx_limits: httpx.Limits | None = None
+	"""Connection pool limits. If set (or if `http2` is set), the agent
+	gets its own HTTP client instead of the shared one. Ignored when
+	`httpx_client` is given."""
+
+	http2: bool | None = None
+	"""Whether to use HTTP/2. None enables it when the optional `h2`
+	package is installed. Ignored when `httpx_client` is given."""
 
 	grpc_channel_factory: Callable[[str], Channel] | None = None
 	"""Factory function that generates a gRPC connection channel for a
@@ -88,6 +211,22 @@ class A2aAgentConfig:
 	"""Mapping of transport labels to transport producers.
 	Used for creating A2A clients with specific transport protocols."""
 
+	emit_interim_artifacts: bool = True
+	"""Whether artifacts of a running task are converted and printed as
+	they arrive. If False, they are only converted once the task has
+	completed."""
+
+	agent_card_ttl: float = 0.0
+	"""Seconds a resolved agent card is reused before the resolver is asked
+	again. 0 asks the resolver on every reply, which suits the built-in
+	resolvers since they cache or receive updates themselves; set it for
+	custom resolvers that fetch on every call."""
+
+	stream_chunk_timeout: float | None = 120.0
+	"""Maximum seconds to wait for the next streamed response item before
+	giving up on the remote agent. None waits indefinitely. Only applies
+	when `streaming` is enabled."""
+
 
 class A2aAgent(AgentBase):
 	"""An A2A agent implementation in AgentScope, which supports
@@ -118,8 +257,6 @@ class A2aAgent(AgentBase):
 						transport preferences and streaming options.
 						Defaults to `A2aAgentConfig()`.
 		"""
-		from a2a.types import AgentCard
-
 		super().__init__()
 		self.name: str = name
 		"""The name of the agent."""
@@ -130,9 +267,22 @@ class A2aAgent(AgentBase):
 		self._agent_card: AgentCard | None = None
 		"""The resolved agent card."""
 
+		self._agent_card_expiry: float = 0.0
+		"""Monotonic time until which `_agent_card` is reused as is, see
+		`A2aAgentConfig.agent_card_ttl`."""
+
 		self._a2a_client_factory: ClientFactory | None = None
 		"""The A2A client factory for creating communication clients."""
 
+		self._a2a_client: tuple[AgentCard, Client] | None = None
+		"""The A2A client built for the current agent card, with that card."""
+
+		self._own_httpx_client: httpx.AsyncClient | None = None
+		"""HTTP client created for this agent's custom pool settings."""
+
+		self._ready_lock = asyncio.Lock()
+		"""Serializes the first `_ensure_ready` among concurrent replies."""
+
 		if agent_card is None:
 			raise ValueError("Agent card cannot be None")
 
@@ -182,7 +332,8 @@ class A2aAgent(AgentBase):
 
 		This method validates the retrieved agent card before using it.
 		If validation fails, the previous agent card is retained
-		(if available).
+		(if available). Resolvers that cache their card hand back the
+		same object, which was already validated and is returned as is.
 
 		Returns:
 				`AgentCard`:
@@ -195,9 +346,20 @@ class A2aAgent(AgentBase):
 						If the resolved agent card is invalid and no
 						previous valid card is available.
 		"""
+		ttl = self._agent_config.agent_card_ttl
+		if (
+			ttl > 0
+			and self._agent_card is not None
+			and time.monotonic() < self._agent_card_expiry
+		):
+			return self._agent_card
+
 		try:
 			# Get new agent card from resolver
 			new_agent_card = await self._agent_card_resolver.get_agent_card()
+			self._agent_card_expiry = time.monotonic() + ttl
+			if new_agent_card is self._agent_card:
+				return new_agent_card
 
 			# Validate the new agent card
 			await self._validate_agent_card(new_agent_card)
@@ -263,21 +425,19 @@ class A2aAgent(AgentBase):
 						message. If an error occurs during communication,
 						returns an error message.
 		"""
-		from a2a.types import Message as A2AMessage, TaskState
-
 		await self._ensure_ready()
 
-		# Merge observed messages with input messages
-		msgs_list: list[Msg] = list(self._observed_msgs)
-
-		if msg is not None:
-			if isinstance(msg, Msg):
-				msgs_list.append(msg)
-			else:
-				msgs_list.extend(msg)
-
-		# Filter out None values
-		msgs_list = [m for m in msgs_list if m is not None]
+		# Merge observed messages with input messages, filtering out None
+		# values, in a single pass
+		if msg is None:
+			incoming: Iterable[Msg | None] = ()
+		elif isinstance(msg, Msg):
+			incoming = (msg,)
+		else:
+			incoming = msg
+		msgs_list: list[Msg] = [
+			m for m in chain(self._observed_msgs, incoming) if m is not None
+		]
 
 		# If no messages to send, return early with a prompt message
 		if not msgs_list:
@@ -305,9 +465,7 @@ class A2aAgent(AgentBase):
 
 		try:
 			# Create A2A client and send message
-			client = self._a2a_client_factory.create(
-					card=await self._get_agent_card(),
-			)
+			client = self._get_a2a_client(await self._get_agent_card())
 
 			logger.debug(
 					"[%s] Sending message to remote agent: %s",
@@ -315,34 +473,59 @@ class A2aAgent(AgentBase):
 					self.name,
 			)
 
-			async for item in client.send_message(a2a_message):
+			chunk_timeout = (
+				self._agent_config.stream_chunk_timeout
+				if self._agent_config.streaming
+				else None
+			)
+			# Checked once instead of per streamed item
+			debug_enabled = logger.isEnabledFor(logging.DEBUG)
+			emit_interim_artifacts = self._agent_config.emit_interim_artifacts
+			async for item in _iter_with_idle_timeout(
+					client.send_message(a2a_message),
+					chunk_timeout,
+			):
 				if isinstance(item, A2AMessage):
 					response_msg = self._convert_a2a_message_to_msg(item)
 					await self.print(response_msg, False)
-					logger.debug(
-							"[%s] Received direct message response",
-							self.__class__.__name__,
-					)
+					if debug_enabled:
+						logger.debug(
+								"[%s] Received direct message response",
+								self.__class__.__name__,
+						)
 
 				elif isinstance(item, tuple):
-					task, _ = item
-					logger.debug(
-							"[%s] Task update: %s, task_id: %s",
-							self.__class__.__name__,
-							task.status.state.value,
-							task.id,
-					)
+					task, update = item
+					if debug_enabled:
+						logger.debug(
+								"[%s] Task update: %s, task_id: %s",
+								self.__class__.__name__,
+								task.status.state.value,
+								task.id,
+						)
 
 					# Construct message from task status
 					status_msg = self._construct_msg_from_task_status(task)
 					await self.print(status_msg, False)
 
-					artifact_msg = self._convert_task_artifacts_to_msg(task)
-					if artifact_msg:
-						await self.print(artifact_msg, False)
+					# Artifacts accumulate on the task, so only re-render them
+					# when they changed or the task finished, instead of on
+					# every status update
+					is_completed = task.status.state == TaskState.completed
+					artifact_msg = None
+					if is_completed or (
+						emit_interim_artifacts
+						and (
+							update is None
+							or isinstance(update, TaskArtifactUpdateEvent)
+						)
+					):
+						artifact_msg = self._convert_task_artifacts_to_msg(task)
+						if artifact_msg:
+							await self.print(artifact_msg, False)
 
 					# Check task status
-					if task.status.state == TaskState.completed:
+					if is_completed:
 						response_msg = artifact_msg
 						logger.debug(
 								"[%s] Task completed successfully: %s",
@@ -350,13 +533,8 @@ class A2aAgent(AgentBase):
 								task.id,
 						)
 					else:
+						# Already logged as a task update above
 						response_msg = status_msg
-						logger.debug(
-								"[%s] Task update: %s, id: %s",
-								self.__class__.__name__,
-								task.status.state.value,
-								task.id,
-						)
 
 		except asyncio.CancelledError:
 			# User interruption - re-raise for proper cancellation handling
@@ -368,11 +546,14 @@ class A2aAgent(AgentBase):
 
 		except Exception as e:
 			# Log error and return error message instead of raising
+			# The traceback is costly to format; only include it when
+			# debugging, the error type and message are always logged
 			logger.error(
-					"[%s] Failed to get response from remote agent: %s",
+					"[%s] Failed to get response from remote agent: %s: %s",
 					self.__class__.__name__,
+					type(e).__name__,
 					e,
-					exc_info=True,
+					exc_info=logger.isEnabledFor(logging.DEBUG),
 			)
 
 			# Create an error response message
@@ -510,18 +691,17 @@ class A2aAgent(AgentBase):
 						ContentBlocks, or `None` if the task has no
 						artifacts.
 		"""
-		if not task.artifacts or len(task.artifacts) == 0:
+		if not task.artifacts:
 			return None
 
-		all_content_blocks: list[ContentBlock] = []
-
-		# Process all artifacts
-		for artifact in task.artifacts:
-			# Convert each part to content block
-			for part in artifact.parts:
-				content_block = self._convert_part_to_content_block(part)
-				if content_block:
-					all_content_blocks.append(content_block)
+		# Single pass over every part of every artifact
+		convert = self._convert_part_to_content_block
+		all_content_blocks: list[ContentBlock] = [
+			content_block
+			for artifact in task.artifacts
+			for part in artifact.parts
+			if (content_block := convert(part))
+		]
 
 		# Create message with all content blocks
 		merged_msg = Msg(
@@ -546,28 +726,24 @@ class A2aAgent(AgentBase):
 						reconstructed. Otherwise, a new Msg with an empty
 						name is created.
 		"""
-		from a2a.types import Role as A2ARole
+		role = _A2A_ROLE_TO_MSG_ROLE.get(a2a_message.role, "user")
 
 		# Group parts by msg_id to reconstruct original messages
-		msg_groups = OrderedDict()  # Preserve order
+		msg_groups: dict[str, dict] = {}  # Insertion-ordered
 		parts_without_metadata = []
 
 		# Process all parts
+		convert_root = self._convert_part_root_to_content_block
 		for part in a2a_message.parts:
+			part_root = part.root
 			# Convert part to content block
-			content_block = self._convert_part_to_content_block(part)
+			content_block = convert_root(part_root)
 			if content_block is None:
 				continue
 
 			# Check if part has AgentScope metadata
-			part_metadata = (
-				part.root.metadata if hasattr(part.root, "metadata") else None
-			)
-			msg_id = (
-				part_metadata.get("_agentscope_msg_id")
-				if part_metadata
-				else None
-			)
+			part_metadata = part_root.metadata or {}
+			msg_id = part_metadata.get(_META_MSG_ID)
 
 			if msg_id:
 				# Has AgentScope metadata - group by msg_id
@@ -575,7 +751,7 @@ class A2aAgent(AgentBase):
 					msg_groups[msg_id] = {
 						"msg_id": msg_id,
 						"msg_source": part_metadata.get(
-								"_agentscope_msg_source",
+								_META_MSG_SOURCE,
 								"",
 						),
 						"content_blocks": [],
@@ -595,13 +771,6 @@ class A2aAgent(AgentBase):
 				if a2a_message.metadata and msg_id in a2a_message.metadata:
 					msg_metadata = a2a_message.metadata[msg_id]
 
-				# Determine role based on A2A message role
-				role: Literal["user", "assistant"] = (
-					"assistant"
-					if a2a_message.role == A2ARole.agent
-					else "user"
-				)
-
 				msg = Msg(
 						name=self.name,
 						content=group_data["content_blocks"],
@@ -615,14 +784,10 @@ class A2aAgent(AgentBase):
 
 		# Case 2: No AgentScope metadata - create new Msg
 		elif parts_without_metadata:
-			role2: Literal["user", "assistant"] = (
-				"assistant" if a2a_message.role == A2ARole.agent else "user"
-			)
-
 			msg = Msg(
 					name=self.name,
 					content=parts_without_metadata,
-					role=role2,
+					role=role,
 					metadata=a2a_message.metadata,
 			)
 			return msg
@@ -633,13 +798,10 @@ class A2aAgent(AgentBase):
 					"[%s] No valid content found in A2A message",
 					self.__class__.__name__,
 			)
-			role3: Literal["user", "assistant"] = (
-				"assistant" if a2a_message.role == A2ARole.agent else "user"
-			)
 			return Msg(
 					name=self.name,
 					content="",
-					role=role3,
+					role=role,
 					metadata=a2a_message.metadata,
 			)
 
@@ -664,47 +826,49 @@ class A2aAgent(AgentBase):
 						The converted ContentBlock, or `None` if the part
 						type is unknown or conversion fails.
 		"""
-		from a2a.types import TextPart, FilePart, DataPart
-
-		part_root = part.root
-
-		# Case 1: TextPart
-		if isinstance(part_root, TextPart):
-			text_content = part_root.text
+		return self._convert_part_root_to_content_block(part.root)
 
-			# Check for AgentScope metadata
-			part_metadata = (
-				part_root.metadata if hasattr(part_root, "metadata") else None
-			)
-			block_type = (
-				part_metadata.get("_agentscope_block_type")
-				if part_metadata
-				else None
-			)
-
-			if block_type == "thinking":
-				# Convert to ThinkingBlock
-				return ThinkingBlock(type="thinking", thinking=text_content)
-			else:
-				# Convert to TextBlock (default)
-				return TextBlock(type="text", text=text_content)
-
-		# Case 2: FilePart
-		elif isinstance(part_root, FilePart):
-			return self._convert_file_part_to_media_block(part_root)
-
-		# Case 3: DataPart
-		elif isinstance(part_root, DataPart):
-			return self._convert_data_part_to_block(part_root)
+	def _convert_part_root_to_content_block(
+			self,
+			part_root: TextPart | FilePart | DataPart,
+	) -> ContentBlock | None:
+		"""Convert the root of an A2A Part to an AgentScope ContentBlock.
 
-		# Unknown part type
-		else:
+		Same as `_convert_part_to_content_block`, for callers that already
+		hold `part.root`.
+		"""
+		converter = self._PART_TO_BLOCK_CONVERTERS.get(type(part_root))
+		if converter is None:
 			logger.debug(
 					"[%s] Unknown part type: %s",
 					self.__class__.__name__,
 					type(part_root),
 			)
 			return None
+		return converter(self, part_root)
+
+	def _convert_text_part_to_block(
+			self,
+			text_part: TextPart,
+	) -> TextBlock | ThinkingBlock:
+		"""Convert an A2A TextPart to a TextBlock, or to a ThinkingBlock if
+		its AgentScope metadata marks it as thinking.
+
+		Args:
+				text_part (`TextPart`):
+						The A2A TextPart to convert.
+
+		Returns:
+				`TextBlock | ThinkingBlock`:
+						The converted block.
+		"""
+		part_metadata = text_part.metadata
+		if (
+			part_metadata
+			and part_metadata.get(_META_BLOCK_TYPE) == "thinking"
+		):
+			return ThinkingBlock(type="thinking", thinking=text_part.text)
+		return TextBlock(type="text", text=text_part.text)
 
 	def _convert_data_part_to_block(self, data_part: DataPart) -> ContentBlock:
 		"""Convert an A2A DataPart to an AgentScope ContentBlock.
@@ -720,19 +884,13 @@ class A2aAgent(AgentBase):
 						(JSON-serialized).
 		"""
 		# Check for AgentScope metadata
-		part_metadata = (
-			data_part.metadata if hasattr(data_part, "metadata") else None
-		)
-		block_type = (
-			part_metadata.get("_agentscope_block_type")
-			if part_metadata
-			else None
-		)
+		part_metadata = data_part.metadata or {}
+		block_type = part_metadata.get(_META_BLOCK_TYPE)
 
 		# Case 1: ToolUse block
 		if block_type == "tool_use":
-			tool_name = part_metadata.get("_agentscope_tool_name")
-			tool_id = part_metadata.get("_agentscope_tool_call_id")
+			tool_name = cast(str, part_metadata.get(_META_TOOL_NAME))
+			tool_id = cast(str, part_metadata.get(_META_TOOL_CALL_ID))
 			tool_input = data_part.data  # Data.data → ToolUse.input
 
 			return ToolUseBlock(
@@ -744,10 +902,10 @@ class A2aAgent(AgentBase):
 
 		# Case 2: ToolResult block
 		elif block_type == "tool_result":
-			tool_name = part_metadata.get("_agentscope_tool_name")
-			tool_id = part_metadata.get("_agentscope_tool_call_id")
+			tool_name = cast(str, part_metadata.get(_META_TOOL_NAME))
+			tool_id = cast(str, part_metadata.get(_META_TOOL_CALL_ID))
 			tool_output = data_part.data.get(
-					"_agentscope_tool_output",
+					_DATA_TOOL_OUTPUT,
 			)  # Data.data._agentscope_tool_output → ToolResult.output
 
 			return ToolResultBlock(
@@ -759,11 +917,7 @@ class A2aAgent(AgentBase):
 
 		# Case 3: No AgentScope metadata - serialize to JSON TextBlock
 		else:
-			data_json = json.dumps(
-					data_part.data,
-					ensure_ascii=False,
-					indent=2,
-			)
+			data_json = _dumps_indented(data_part.data)
 			return TextBlock(type="text", text=data_json)
 
 	def _convert_file_part_to_media_block(
@@ -781,12 +935,10 @@ class A2aAgent(AgentBase):
 						The converted media block, or `None` if the media type
 						cannot be determined from the MIME type.
 		"""
-		from a2a.types import FileWithUri, FileWithBytes
-
 		file_obj = file_part.file
 
 		# Determine media type from mime_type
-		mime_type = getattr(file_obj, "mime_type", None)
+		mime_type = file_obj.mime_type
 		block_type = None
 
 		if mime_type:
@@ -836,6 +988,16 @@ class A2aAgent(AgentBase):
 
 		return None
 
+	_PART_TO_BLOCK_CONVERTERS: dict[
+		type,
+		Callable[..., ContentBlock | None],
+	] = {
+		TextPart: _convert_text_part_to_block,
+		FilePart: _convert_file_part_to_media_block,
+		DataPart: _convert_data_part_to_block,
+	}
+	"""A2A part root type -> converter to an AgentScope ContentBlock."""
+
 	def _convert_msgs_to_a2a_message(self, msgs: list[Msg]) -> A2AMessage:
 		"""Convert a list of AgentScope Msgs to a single A2A Message.
 
@@ -848,14 +1010,7 @@ class A2aAgent(AgentBase):
 						A single A2A Message containing all content from
 						the input messages, with tracking metadata preserved.
 		"""
-		from a2a.types import (
-			Message as A2AMessage,
-			Part,
-			Role as A2ARole,
-			TextPart,
-		)
-
-		merged_parts = []
+		merged_parts: list[Part] = []
 		a2a_metadata = {}
 
 		# Process all messages
@@ -864,39 +1019,10 @@ class A2aAgent(AgentBase):
 				continue
 
 			# Store msg metadata in A2A message metadata using msg.id as key
-			if msg.metadata and len(msg.metadata) > 0:
+			if msg.metadata:
 				a2a_metadata[msg.id] = msg.metadata
 
-			# Prepare part metadata with source information
-			part_metadata = {
-				"_agentscope_msg_source": msg.name,
-				"_agentscope_msg_id": msg.id,
-			}
-
-			# Process message content
-			if isinstance(msg.content, str):
-				# Simple string content - convert to text part with metadata
-				if msg.content.strip():  # Filter empty strings
-					merged_parts.append(
-							Part(
-									root=TextPart(
-											text=msg.content,
-											metadata=part_metadata,
-									),
-							),
-					)
-
-			elif isinstance(msg.content, list):
-				# ContentBlock list - process all types
-				for block in msg.content:
-					part = self._convert_content_block_to_part(block)
-					if part:  # Filter None results
-						# Merge metadata on the part's root object
-						if part.root.metadata:
-							part.root.metadata.update(part_metadata)
-						else:
-							part.root.metadata = part_metadata
-						merged_parts.append(part)
+			merged_parts.extend(self._convert_msg_to_parts(msg))
 
 		# If no parts were extracted, add empty text part
 		if not merged_parts:
@@ -908,7 +1034,7 @@ class A2aAgent(AgentBase):
 
 		# Build A2A Message with merged content
 		a2a_message = A2AMessage(
-				message_id=str(uuid4()),
+				message_id=token_hex(16),
 				role=A2ARole.user,
 				parts=merged_parts,
 				metadata=a2a_metadata if a2a_metadata else None,
@@ -923,6 +1049,125 @@ class A2aAgent(AgentBase):
 
 		return a2a_message
 
+	def _convert_msg_to_parts(self, msg: Msg) -> list[Part]:
+		"""Convert the content of an AgentScope Msg to A2A Parts.
+
+		Every part is tagged with the source and id of the Msg, so that
+		the receiving side can regroup the parts into messages.
+
+		Args:
+				msg (`Msg`):
+						The message to convert.
+
+		Returns:
+				`list[Part]`:
+						The converted parts; empty text and unsupported
+						blocks are dropped.
+		"""
+		# Prepare part metadata with source information
+		part_metadata = {
+			_META_MSG_SOURCE: msg.name,
+			_META_MSG_ID: msg.id,
+		}
+
+		content = msg.content
+		if isinstance(content, str):
+			# Simple string content - convert to text part with metadata
+			if not content or content.isspace():  # Filter empty strings
+				return []
+			return [
+				Part(root=TextPart(text=content, metadata=part_metadata)),
+			]
+
+		if not isinstance(content, list):
+			return []
+
+		# ContentBlock list - process all types, filtering None results
+		convert_block = self._convert_content_block_to_part
+		parts = [
+			part for block in content if (part := convert_block(block))
+		]
+		for part in parts:
+			# Merge metadata on the part's root object
+			root = part.root
+			if root.metadata:
+				root.metadata.update(part_metadata)
+			else:
+				root.metadata = part_metadata
+		return parts
+
+	def _convert_text_block_to_part(
+			self,
+			block: TextBlock | ThinkingBlock,
+	) -> Part | None:
+		"""Convert a TextBlock or ThinkingBlock to an A2A TextPart.
+
+		The text lives under the key named like the block type ("text" or
+		"thinking"), which is also recorded in the part metadata.
+		"""
+		if block["type"] == "thinking":
+			text = block.get("thinking", "")
+		else:
+			text = block.get("text", "")
+		if text and not text.isspace():
+			return Part(
+					root=TextPart(
+							text=text,
+							metadata={_META_BLOCK_TYPE: block["type"]},
+					),
+			)
+		return None
+
+	def _convert_media_block_to_part(
+			self,
+			block: ImageBlock | AudioBlock | VideoBlock,
+	) -> Part | None:
+		"""Convert an Image, Audio or Video block to an A2A FilePart."""
+		return self._convert_media_block_to_file_part(block, block["type"])
+
+	def _convert_tool_use_block_to_part(self, block: ToolUseBlock) -> Part:
+		"""Convert a ToolUseBlock to an A2A DataPart."""
+		return Part(
+				root=DataPart(
+						data=block.get("input", {}),  # ToolUse.input → Data.data
+						metadata={
+							_META_BLOCK_TYPE: "tool_use",
+							_META_TOOL_NAME: block.get("name"),
+							_META_TOOL_CALL_ID: block.get("id"),
+						},
+				),
+		)
+
+	def _convert_tool_result_block_to_part(
+			self,
+			block: ToolResultBlock,
+	) -> Part:
+		"""Convert a ToolResultBlock to an A2A DataPart."""
+		return Part(
+				root=DataPart(
+						data={
+							_DATA_TOOL_OUTPUT: block.get("output"),
+						},
+						# ToolResult.output → Data.data._agentscope_tool_output
+						metadata={
+							_META_BLOCK_TYPE: "tool_result",
+							_META_TOOL_NAME: block.get("name"),
+							_META_TOOL_CALL_ID: block.get("id"),
+						},
+				),
+		)
+
+	_BLOCK_TO_PART_CONVERTERS: dict[str, Callable[..., Part | None]] = {
+		"text": _convert_text_block_to_part,
+		"thinking": _convert_text_block_to_part,
+		"image": _convert_media_block_to_part,
+		"audio": _convert_media_block_to_part,
+		"video": _convert_media_block_to_part,
+		"tool_use": _convert_tool_use_block_to_part,
+		"tool_result": _convert_tool_result_block_to_part,
+	}
+	"""Content block type -> converter to an A2A Part."""
+
 	def _convert_content_block_to_part(
 			self,
 			block: ContentBlock,
@@ -938,86 +1183,20 @@ class A2aAgent(AgentBase):
 						The converted A2A Part object, or `None` if the
 						block is empty or of an unsupported type.
 		"""
-		from a2a.types import Part, TextPart, DataPart
-
 		block_type = block["type"]
-
-		# Text and Thinking blocks -> TextPart
-		if block_type == "text":
-			text = block.get("text", "")
-			if text and text.strip():
-				return Part(
-						root=TextPart(
-								text=text,
-								metadata={"_agentscope_block_type": "text"},
-						),
-				)
-			return None
-
-		elif block_type == "thinking":
-			thinking = block.get("thinking", "")
-			if thinking and thinking.strip():
-				return Part(
-						root=TextPart(
-								text=thinking,
-								metadata={"_agentscope_block_type": "thinking"},
-						),
-				)
-			return None
-
-		# Image, Audio, Video blocks -> FilePart
-		elif block_type in ["image", "audio", "video"]:
-			return self._convert_media_block_to_file_part(block, block_type)
-
-		# ToolUse block -> DataPart
-		elif block_type == "tool_use":
-			tool_id = block.get("id")
-			tool_name = block.get("name")
-			tool_input = block.get("input", {})
-
-			return Part(
-					root=DataPart(
-							data=tool_input,  # ToolUse.input → Data.data
-							metadata={
-								"_agentscope_block_type": "tool_use",
-								"_agentscope_tool_name": tool_name,
-								"_agentscope_tool_call_id": tool_id,
-							},
-					),
-			)
-
-		# ToolResult block -> DataPart
-		elif block_type == "tool_result":
-			tool_id = block.get("id")
-			tool_name = block.get("name")
-			tool_output = block.get("output")
-
-			return Part(
-					root=DataPart(
-							data={
-								"_agentscope_tool_output": tool_output,
-							},
-							# ToolResult.output → Data.data._agentscope_tool_output
-							metadata={
-								"_agentscope_block_type": "tool_result",
-								"_agentscope_tool_name": tool_name,
-								"_agentscope_tool_call_id": tool_id,
-							},
-					),
-			)
-
-		# Unknown or unsupported block type
-		else:
+		converter = self._BLOCK_TO_PART_CONVERTERS.get(block_type)
+		if converter is None:
 			logger.debug(
 					"[%s] Unsupported content block type: %s",
 					self.__class__.__name__,
 					block_type,
 			)
 			return None
+		return converter(self, block)
 
 	def _convert_media_block_to_file_part(
 			self,
-			block: ContentBlock,
+			block: ImageBlock | AudioBlock | VideoBlock,
 			media_type: str,
 	) -> Part | None:
 		"""Convert a media ContentBlock to an A2A FilePart.
@@ -1033,8 +1212,6 @@ class A2aAgent(AgentBase):
 						An A2A Part containing a FilePart, or `None` if the
 						conversion fails.
 		"""
-		from a2a.types import Part, FilePart, FileWithUri, FileWithBytes
-
 		source = block.get("source")
 		if not source:
 			logger.warning(
@@ -1048,7 +1225,7 @@ class A2aAgent(AgentBase):
 
 		# URL source -> FileWithUri
 		if source_type == "url":
-			url = source.get("url")
+			url = cast(URLSource, source).get("url")
 			if not url:
 				logger.warning(
 						"[%s] %s block with url source missing url",
@@ -1068,8 +1245,9 @@ class A2aAgent(AgentBase):
 
 		# Base64 source -> FileWithBytes
 		elif source_type == "base64":
-			data = source.get("data")
-			mime_type = source.get("media_type")
+			base64_source = cast(Base64Source, source)
+			data = base64_source.get("data")
+			mime_type = base64_source.get("media_type")
 
 			if not data:
 				logger.warning(
@@ -1115,14 +1293,7 @@ class A2aAgent(AgentBase):
 						unknown types.
 		"""
 		# Return generic MIME type based on media category
-		if media_type == "image":
-			return "image/*"
-		elif media_type == "audio":
-			return "audio/*"
-		elif media_type == "video":
-			return "video/*"
-		else:
-			return "application/octet-stream"
+		return _GENERIC_MIME_TYPES.get(media_type, "application/octet-stream")
 
 	async def _ensure_ready(self) -> None:
 		"""Ensure the A2A client is initialized and ready for communication.
@@ -1131,32 +1302,120 @@ class A2aAgent(AgentBase):
 				This method is idempotent and can be called multiple times
 				safely.
 		"""
-		from a2a.client import ClientFactory
-
 		if self._is_ready and self._a2a_client_factory is not None:
 			return
 
-		agent_card = await self._agent_card_resolver.get_agent_card()
-		await self._validate_agent_card(agent_card)
-		self._agent_card = agent_card
+		async with self._ready_lock:
+			# Another reply may have finished the setup while we waited
+			if self._is_ready and self._a2a_client_factory is not None:
+				return
+
+			agent_card = await self._agent_card_resolver.get_agent_card()
+			await self._validate_agent_card(agent_card)
+			self._agent_card = agent_card
+			# Let the first reply reuse this card within agent_card_ttl
+			self._agent_card_expiry = (
+				time.monotonic() + self._agent_config.agent_card_ttl
+			)
 
-		a2a_client_config = self._extract_a2a_client_config()
+			a2a_client_config = self._extract_a2a_client_config()
 
-		self._a2a_client_factory = ClientFactory(
-				config=a2a_client_config,
-				consumers=self._agent_config.consumers,
-		)
+			self._a2a_client_factory = ClientFactory(
+					config=a2a_client_config,
+					consumers=self._agent_config.consumers,
+			)
 
-		for (
-				transport_label,
-				transport_producer,
-		) in self._agent_config.additional_transport_producers.items():
-			self._a2a_client_factory.register(
+			for (
 					transport_label,
 					transport_producer,
+			) in self._agent_config.additional_transport_producers.items():
+				self._a2a_client_factory.register(
+						transport_label,
+						transport_producer,
+				)
+
+			self._is_ready = True
+
+	def _get_a2a_client(self, agent_card: AgentCard) -> Client:
+		"""Get the A2A client for the given agent card.
+
+		The client is built once per card and reused across replies; a new
+		card (e.g. pushed by Nacos) gets a new client.
+
+		Args:
+				agent_card (`AgentCard`):
+						The current, validated agent card.
+
+		Returns:
+				`Client`:
+						The A2A client talking to the agent of the card.
+		"""
+		cached = self._a2a_client
+		if cached is not None and cached[0] is agent_card:
+			return cached[1]
+
+		# The previous client is dropped rather than closed: closing it
+		# would close the httpx client, which is shared or caller-owned
+		client = self._a2a_client_factory.create(card=agent_card)
+		self._a2a_client = (agent_card, client)
+		return client
+
+	@classmethod
+	async def aclose_all(cls) -> None:
+		"""Close the shared HTTP client of the running event loop.
+
+		Call this on application shutdown. Clients passed explicitly via
+		`A2aAgentConfig.httpx_client` are owned by the caller and are not
+		closed.
+		"""
+		await aclose_shared_httpx_client()
+
+	@classmethod
+	async def initialize_all(cls, agents: list["A2aAgent"]) -> None:
+		"""Resolve the agent cards and set up the clients of many agents
+		concurrently.
+
+		Agents otherwise initialize lazily on their first reply, one card
+		fetch after another when several are started together. Calling
+		this at startup overlaps those fetches.
+
+		Args:
+				agents (`list[A2aAgent]`):
+						The agents to initialize.
+		"""
+		await asyncio.gather(*(agent._ensure_ready() for agent in agents))
+
+	def _get_httpx_client(self) -> httpx.AsyncClient:
+		"""Get the HTTP client this agent talks to the remote agent with.
+
+		Returns:
+				`httpx.AsyncClient`:
+						The configured client if any, else a client of
+						this agent's own when pool settings are customized,
+						else the shared client.
+		"""
+		config = self._agent_config
+		if config.httpx_client is not None:
+			return config.httpx_client
+		if config.httpx_limits is None and config.http2 is None:
+			return get_shared_httpx_client()
+		if self._own_httpx_client is None or self._own_httpx_client.is_closed:
+			self._own_httpx_client = create_httpx_client(
+					limits=config.httpx_limits,
+					http2=config.http2,
 			)
+		return self._own_httpx_client
 
-		self._is_ready = True
+	async def aclose(self) -> None:
+		"""Close the HTTP client created for this agent, if any.
+
+		Shared and caller-provided clients are left open.
+		"""
+		client, self._own_httpx_client = self._own_httpx_client, None
+		self._a2a_client = None
+		self._is_ready = False
+		if client is not None:
+			await client.aclose()
 
 	def _extract_a2a_client_config(self) -> ClientConfig:
 		"""Extract A2A client configuration from agent config.
@@ -1166,13 +1425,10 @@ class A2aAgent(AgentBase):
 						The extracted client configuration
 												for A2A communication.
 		"""
-		from a2a.client import ClientConfig
-		from a2a.types import TransportProtocol
-
 		a2a_client_config = ClientConfig(
 				streaming=self._agent_config.streaming,
 				polling=self._agent_config.polling,
-				httpx_client=self._agent_config.httpx_client,
+				httpx_client=self._get_httpx_client(),
 				grpc_channel_factory=self._agent_config.grpc_channel_factory,
 				supported_transports=self._agent_config.supported_transports
 									 or [TransportProtocol.jsonrpc],
@@ -1207,8 +1463,7 @@ class A2aAgent(AgentBase):
 
 		# Validate URL format
 		try:
-			parsed_url = urlparse(str(agent_card.url))
-			if not parsed_url.scheme or not parsed_url.netloc:
+			if not _is_absolute_url(str(agent_card.url)):
 				logger.error(
 						"[%s] Invalid RPC URL format: %s",
 						self.__class__.__name__,
@@ -6,18 +6,96 @@ from different sources including fixed values, files, and URLs.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
+import os
+import time
+import weakref
 from abc import abstractmethod
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from urllib.parse import urlparse
 
-if TYPE_CHECKING:
-	from a2a.types import AgentCard
+import httpx
+from a2a.types import AgentCard
+from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH
+
+from agentscope_extension_nacos.a2a._http import get_shared_httpx_client
+
+try:
+	import orjson
+	_json_loads = orjson.loads
+except ImportError:  # optional speedup
+	_json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+_CARD_CACHE_TTL = float(os.getenv("A2A_CARD_CACHE_TTL", "60"))
+"""Seconds a card resolved by DefaultA2ACardResolver is reused; 0 disables
+the cache."""
+
+_CARD_CACHE_MAX_SIZE = 256
+"""Most cards kept by the DefaultA2ACardResolver cache; the oldest are
+evicted first."""
+
+# (agent_card_source, httpx_client) -> (resolved_at, AgentCard), oldest
+# first and shared by all resolvers. The client is part of the key since it
+# may carry its own auth or headers; None stands for the shared client and
+# for file sources
+_CardCacheKey = tuple[str, httpx.AsyncClient | None]
+_card_cache: OrderedDict[_CardCacheKey, tuple[float, AgentCard]] = OrderedDict()
+# event loop -> {cache key: lock of the fetch in flight}; keyed by loop
+# since an asyncio lock cannot be shared across loops, and entries go away
+# with their loop
+_card_locks: weakref.WeakKeyDictionary[
+	asyncio.AbstractEventLoop, dict[_CardCacheKey, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+_HTTP_PREFIXES = ("http://", "https://")
+"""Agent card sources with these prefixes are fetched over HTTP."""
+
+
+def _get_cached_card(key: _CardCacheKey) -> AgentCard | None:
+	"""Return the cached card for ``key`` if it has not expired yet, dropping
+	it from the cache otherwise."""
+	cached = _card_cache.get(key)
+	if cached is None:
+		return None
+	if time.monotonic() - cached[0] < _CARD_CACHE_TTL:
+		return cached[1]
+	del _card_cache[key]
+	return None
+
+
+def _cache_card(key: _CardCacheKey, agent_card: AgentCard) -> None:
+	"""Store a freshly resolved card, evicting expired entries and the
+	oldest ones beyond ``_CARD_CACHE_MAX_SIZE``."""
+	now = time.monotonic()
+	_card_cache.pop(key, None)
+	_card_cache[key] = (now, agent_card)
+	# Entries are ordered by resolve time, so expired ones are at the front
+	while _card_cache:
+		oldest_key, (resolved_at, _) = next(iter(_card_cache.items()))
+		if (
+			len(_card_cache) <= _CARD_CACHE_MAX_SIZE
+			and now - resolved_at < _CARD_CACHE_TTL
+		):
+			break
+		del _card_cache[oldest_key]
+
+
+@functools.lru_cache(maxsize=128)
+def _load_agent_card_json(path: str, mtime_ns: int, size: int) -> dict:
+	"""Read and parse an agent card file.
+
+	``mtime_ns`` and ``size`` are only part of the cache key, so editing the
+	file invalidates its entry. Callers must not mutate the returned dict.
+	"""
+	return _json_loads(Path(path).read_bytes())
+
 
 class AgentCardResolverBase:
 	"""Base class for A2A Agent Card resolvers.
@@ -26,6 +104,8 @@ class AgentCardResolverBase:
 	from various sources (Fixed AgentCard, URL, file, etc.).
 	"""
 
+	__slots__ = ()
+
 	@abstractmethod
 	async def get_agent_card(self) -> AgentCard:
 		"""Get Agent Card from the configured source.
@@ -39,6 +119,10 @@ class AgentCardResolverBase:
 class FixedAgentCardResolver(AgentCardResolverBase):
 	"""Agent card resolver that returns a fixed AgentCard."""
 
+	__slots__ = (
+		"agent_card",
+	)
+
 	def __init__(self, agent_card: AgentCard) -> None:
 		"""Initialize the FixedAgentCardResolver.
 
@@ -86,6 +170,11 @@ class FileAgentCardResolver(AgentCardResolverBase):
 		}
 	"""
 
+	__slots__ = (
+		"_file_path",
+		"_cached_card",
+	)
+
 	def __init__(
 			self,
 			file_path: str,
@@ -97,41 +186,56 @@ class FileAgentCardResolver(AgentCardResolverBase):
 						The path to the JSON file containing the agent card.
 		"""
 		self._file_path = file_path
+		self._cached_card: tuple[tuple[int, int], AgentCard] | None = None
+		"""``((st_mtime_ns, st_size), card)`` of the last load."""
 
 	async def get_agent_card(self) -> AgentCard:
 		"""Get the agent card from the file.
 
+		The card is only re-read when the file's modification time or size
+		changed, otherwise the previously loaded card object is returned.
+
 		Returns:
 				`AgentCard`:
 						The agent card loaded from the file.
 		"""
 		return await self._resolve_agent_card()
 
-	async def _resolve_agent_card(self) -> AgentCard:
-		from a2a.types import AgentCard
+	def _load_agent_card(self) -> AgentCard:
+		path = Path(self._file_path)
+		if not path.exists():
+			logger.error(
+					"[%s] Agent card file not found: %s",
+					self.__class__.__name__,
+					self._file_path,
+			)
+			raise FileNotFoundError(
+					f"Agent card file not found: {self._file_path}",
+			)
+		if not path.is_file():
+			logger.error(
+					"[%s] Path is not a file: %s",
+					self.__class__.__name__,
+					self._file_path,
+			)
+			raise ValueError(f"Path is not a file: {self._file_path}")
+		stat = path.stat()
+		key = (stat.st_mtime_ns, stat.st_size)
+		cached = self._cached_card
+		if cached is not None and cached[0] == key:
+			return cached[1]
+
+		card = AgentCard.model_validate(
+				_load_agent_card_json(str(path.resolve()), *key),
+		)
+		self._cached_card = (key, card)
+		return card
 
+	async def _resolve_agent_card(self) -> AgentCard:
 		try:
-			path = Path(self._file_path)
-			if not path.exists():
-				logger.error(
-						"[%s] Agent card file not found: %s",
-						self.__class__.__name__,
-						self._file_path,
-				)
-				raise FileNotFoundError(
-						f"Agent card file not found: {self._file_path}",
-				)
-			if not path.is_file():
-				logger.error(
-						"[%s] Path is not a file: %s",
-						self.__class__.__name__,
-						self._file_path,
-				)
-				raise ValueError(f"Path is not a file: {self._file_path}")
-
-			with path.open("r", encoding="utf-8") as f:
-				agent_json_data = json.load(f)
-				return AgentCard(**agent_json_data)
+			# Keep file system access and validation off the event loop.
+			# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+			return await asyncio.to_thread(self._load_agent_card)
 		except json.JSONDecodeError as e:
 			logger.error(
 					"[%s] Invalid JSON in agent card file %s: %s",
@@ -158,10 +262,20 @@ class FileAgentCardResolver(AgentCardResolverBase):
 class WellKnownAgentCardResolver(AgentCardResolverBase):
 	"""Agent card resolver that loads AgentCard from a well-known URL."""
 
+	__slots__ = (
+		"_base_url",
+		"_agent_card_path",
+		"_httpx_client",
+		"_card_url",
+		"_cached_card",
+		"_validators",
+	)
+
 	def __init__(
 			self,
 			base_url: str,
 			agent_card_path: str | None = None,
+			httpx_client: httpx.AsyncClient | None = None,
 	) -> None:
 		"""Initialize the WellKnownAgentCardResolver.
 
@@ -171,55 +285,58 @@ class WellKnownAgentCardResolver(AgentCardResolverBase):
 				agent_card_path (`str | None`, optional):
 						The path to the agent card relative to the base URL.
 						Defaults to AGENT_CARD_WELL_KNOWN_PATH from a2a.utils.
+				httpx_client (`httpx.AsyncClient | None`, optional):
+						HTTP client to fetch the card with, e.g. the one
+						used for the A2A calls. If None, the HTTP client
+						shared by the A2A agents of the running event
+						loop is used.
 		"""
 		self._base_url = base_url
 		self._agent_card_path = agent_card_path
+		self._httpx_client = httpx_client
+		self._card_url: str | None = None
+		"""Full URL of the agent card, built once the base URL is validated."""
+		self._cached_card: AgentCard | None = None
+		"""Last fetched card, returned again when the server answers 304."""
+		self._validators: dict[str, str] = {}
+		"""Conditional request headers (``If-None-Match`` /
+		``If-Modified-Since``) derived from the last response."""
 
 	async def get_agent_card(self) -> AgentCard:
 		"""Get the agent card from the well-known URL.
 
+		Once a card has been fetched, later fetches are conditional on its
+		ETag or Last-Modified header, and the same card object is returned
+		if the server reports it unchanged.
+
 		Returns:
 				`AgentCard`:
 						The agent card loaded from the URL.
 		"""
-		import httpx
-		from a2a.client import A2ACardResolver
-		from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH
-
 		try:
-			parsed_url = urlparse(self._base_url)
-			if not parsed_url.scheme or not parsed_url.netloc:
-				logger.error(
-						"[%s] Invalid URL format: %s",
-						self.__class__.__name__,
-						self._base_url,
-				)
-				raise ValueError(
-						f"Invalid URL format: {self._base_url}",
-				)
-
-			base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-			relative_card_path = parsed_url.path
+			card_url = self._card_url or self._build_card_url()
 
-			# Use default path if not specified
-			agent_card_path = (
-				self._agent_card_path
-				if self._agent_card_path is not None
-				else AGENT_CARD_WELL_KNOWN_PATH
+			# Reuse pooled connections instead of a client per fetch
+			httpx_client = self._httpx_client or get_shared_httpx_client()
+			response = await httpx_client.get(
+					card_url,
+					headers=self._validators if self._cached_card else None,
 			)
-
-			# Use async context manager to ensure proper cleanup
-			async with httpx.AsyncClient(
-					timeout=httpx.Timeout(timeout=600),
-			) as _http_client:
-				resolver = A2ACardResolver(
-						httpx_client=_http_client,
-						base_url=base_url,
-						agent_card_path=agent_card_path,
-				)
-				return await resolver.get_agent_card(
-						relative_card_path=relative_card_path,
+			if response.status_code == 304 and self._cached_card is not None:
+				return self._cached_card
+			response.raise_for_status()
+
+			agent_card = AgentCard.model_validate(_json_loads(response.content))
+			self._cached_card = agent_card
+			self._validators = {
+				request_header: response.headers[response_header]
+				for response_header, request_header in (
+					("etag", "If-None-Match"),
+					("last-modified", "If-Modified-Since"),
 				)
+				if response_header in response.headers
+			}
+			return agent_card
 		except Exception as e:
 			logger.error(
 					"[%s] Failed to resolve agent card from URL %s: %s",
@@ -232,4 +349,122 @@ class WellKnownAgentCardResolver(AgentCardResolverBase):
 					f"{self._base_url}: {e}",
 			) from e
 
+	def _build_card_url(self) -> str:
+		"""Validate the base URL and build the agent card URL from it.
+
+		A path in the base URL locates the card itself; without one, the
+		configured (or well-known) agent card path is used.
+		"""
+		parsed_url = urlparse(self._base_url)
+		if not parsed_url.scheme or not parsed_url.netloc:
+			logger.error(
+					"[%s] Invalid URL format: %s",
+					self.__class__.__name__,
+					self._base_url,
+			)
+			raise ValueError(
+					f"Invalid URL format: {self._base_url}",
+			)
+
+		card_path = parsed_url.path or (
+			self._agent_card_path
+			if self._agent_card_path is not None
+			else AGENT_CARD_WELL_KNOWN_PATH
+		)
+		self._card_url = (
+			f"{parsed_url.scheme}://{parsed_url.netloc}/"
+			f"{card_path.lstrip('/')}"
+		)
+		return self._card_url
+
+
+class DefaultA2ACardResolver(AgentCardResolverBase):
+	"""Agent card resolver that picks the source type automatically.
+
+	URLs (``http://`` or ``https://``) are resolved through
+	:class:`WellKnownAgentCardResolver`, anything else is treated as a
+	path to a JSON file and resolved through :class:`FileAgentCardResolver`.
+
+	Resolved cards are cached per source and HTTP client for
+	``A2A_CARD_CACHE_TTL`` seconds (default 60), and concurrent misses for
+	the same source share a single fetch. The cache is process-wide and
+	holds at most ``_CARD_CACHE_MAX_SIZE`` cards.
+	"""
+
+	__slots__ = (
+		"agent_card_source",
+		"_cache_key",
+		"_delegate",
+	)
+
+	def __init__(
+			self,
+			agent_card_source: str,
+			httpx_client: httpx.AsyncClient | None = None,
+	) -> None:
+		"""Initialize the DefaultA2ACardResolver.
+
+		Args:
+				agent_card_source (`str`):
+						The URL or file path of the agent card.
+				httpx_client (`httpx.AsyncClient | None`, optional):
+						HTTP client used for URL sources, so card fetches
+						can share the connection pool of the A2A calls.
+		"""
+		self.agent_card_source = agent_card_source
+		if agent_card_source.startswith(_HTTP_PREFIXES):
+			self._delegate: AgentCardResolverBase = WellKnownAgentCardResolver(
+					agent_card_source,
+					httpx_client=httpx_client,
+			)
+			self._cache_key: _CardCacheKey = (agent_card_source, httpx_client)
+		else:
+			self._delegate = FileAgentCardResolver(agent_card_source)
+			self._cache_key = (agent_card_source, None)
+
+	async def get_agent_card(self) -> AgentCard:
+		"""Get the agent card from the configured source.
+
+		Returns:
+				`AgentCard`:
+						The resolved agent card.
+		"""
+		if _CARD_CACHE_TTL <= 0:
+			return await self._delegate.get_agent_card()
+
+		key = self._cache_key
+		agent_card = _get_cached_card(key)
+		if agent_card is not None:
+			return agent_card
+
+		loop = asyncio.get_running_loop()
+		loop_locks = _card_locks.get(loop)
+		if loop_locks is None:
+			loop_locks = _card_locks[loop] = {}
+		lock = loop_locks.get(key)
+		if lock is None:
+			lock = loop_locks[key] = asyncio.Lock()
+		async with lock:
+			# Another caller may have refreshed the card while we waited
+			agent_card = _get_cached_card(key)
+			if agent_card is not None:
+				return agent_card
+
+			try:
+				agent_card = await self._delegate.get_agent_card()
+			finally:
+				# Callers already queued on the lock still get it and see
+				# the fresh cache entry; later misses start a new lock
+				if loop_locks.get(key) is lock:
+					del loop_locks[key]
+			_cache_card(key, agent_card)
+			logger.debug(
+					"[%s] Cached agent card for %s",
+					self.__class__.__name__,
+					self.agent_card_source,
+			)
+			return agent_card
 
+	def invalidate(self) -> None:
+		"""Drop the cached card so the next call fetches it again."""
+		_card_cache.pop(self._cache_key, None)
@@ -37,15 +37,40 @@ Usage Examples:
     >>> agent = A2aAgent(agent_card_source=None, agent_card_resolver=resolver)
 """
 
-from agentscope_extension_nacos.a2a.nacos.nacos_a2a_adapter import (
-    A2AFastAPINacosAdaptor,
-)
+import importlib
+
+# Public names are resolved on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "A2AFastAPINacosAdaptor": (
+        "agentscope_extension_nacos.a2a.nacos.nacos_a2a_adapter",
+        "A2AFastAPINacosAdaptor",
+    ),
+    "NacosA2ACardResolver": (
+        "agentscope_extension_nacos.a2a.nacos.nacos_a2a_card_resolver",
+        "NacosAgentCardResolver",
+    ),
+}
+
+
+def __getattr__(name):
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target
+    value = getattr(importlib.import_module(module_name), attr_name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
-from agentscope_extension_nacos.a2a.nacos.nacos_a2a_card_resolver import (
-    NacosA2ACardResolver,
-)
 
-__all__ = [
+def __dir__():
+    return sorted(set(globals()) | _ALL_SET)
+
+
+__all__ = (
     "A2AFastAPINacosAdaptor",
     "NacosA2ACardResolver",
-]
+)
+
+# Membership set for __dir__, built once
+_ALL_SET = frozenset(__all__)
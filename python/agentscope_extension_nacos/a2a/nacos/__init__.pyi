@@ -0,0 +1,11 @@
+from agentscope_extension_nacos.a2a.nacos.nacos_a2a_adapter import (
+    A2AFastAPINacosAdaptor as A2AFastAPINacosAdaptor,
+)
+from agentscope_extension_nacos.a2a.nacos.nacos_a2a_card_resolver import (
+    NacosAgentCardResolver as NacosA2ACardResolver,
+)
+
+__all__ = (
+    "A2AFastAPINacosAdaptor",
+    "NacosA2ACardResolver",
+)
@@ -19,6 +19,25 @@ from agentscope_extension_nacos.utils import get_first_non_loopback_ip
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Capabilities and skill advertised by every adapter's agent card, built
+# once. They are shared by the cards, so treat them as read-only.
+_DEFAULT_CAPABILITIES = AgentCapabilities(
+		streaming=False,
+		push_notifications=False,
+		state_transition_history=False,
+)
+_DIALOG_SKILL = AgentSkill(
+		id="dialog",
+		name="Natural Language Dialog Skill",
+		description="Enables natural language conversation and dialogue "
+					"with users",
+		tags=["natural language", "dialog", "conversation"],
+		examples=[
+			"Hello, how are you?",
+			"Can you help me with something?",
+		],
+)
+
 
 class A2AFastAPINacosAdaptor(ProtocolAdapter):
 	"""FastAPI-based A2A protocol adapter with Nacos service registration.
@@ -53,10 +72,12 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		self._agent = agent
 		self._host = host or get_first_non_loopback_ip()
 		self._port = port
+		self._base_agent_url = f"http://{self._host}:{self._port}"
 		self._nacos_client_config = nacos_client_config
 		self.nacos_ai_service: NacosAIService | None = None
 		self._root_path: str = ""
 		self._agent_card: AgentCard | None = None
+		self._card_key: tuple[str, int, str] | None = None
 		self._register_task: asyncio.Task | None = None
 		
 		logger.info(f"[{self.__class__.__name__}] Initialized for agent: {agent.name} at {self._host}:{self._port}")
@@ -77,7 +98,7 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		if app_root_path:
 			# root_path usually starts with /, use it directly
 			self._root_path = app_root_path
-			logger.debug(f"[{self.__class__.__name__}] Using root_path: {self._root_path}")
+			logger.debug("[%s] Using root_path: %s", self.__class__.__name__, self._root_path)
 		
 		# Create request handler with agent executor
 		request_handler = DefaultRequestHandler(
@@ -88,7 +109,9 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		# Create agent card with correct URL
 		self._agent_card = self._create_agent_card()
 		logger.info(f"[{self.__class__.__name__}] Agent card created for: {self._agent_card.name}")
-		logger.debug(f"[{self.__class__.__name__}] Agent card:\n{self._agent_card.model_dump_json(indent=2)}")
+		if logger.isEnabledFor(logging.DEBUG):
+			# Dumping the card is costly, only do it when it will be logged
+			logger.debug("[%s] Agent card:\n%s", self.__class__.__name__, self._agent_card.model_dump_json(indent=2))
 
 		# Create A2A FastAPI application
 		server = A2AFastAPIApplication(
@@ -126,37 +149,24 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		- Endpoint URL (http://{host}:{port}{root_path})
 		- Agent metadata
 		
+		The card is reused as long as host, port and root_path are unchanged.
+		
 		Returns:
 			AgentCard: Complete agent card object
 		"""
-		# Define agent capabilities
-		capabilities = AgentCapabilities(
-				streaming=False,
-				push_notifications=False,
-				state_transition_history=False,
-		)
-		
-		# Define agent skills
-		skill = AgentSkill(
-				id="dialog",
-				name="Natural Language Dialog Skill",
-				description="Enables natural language conversation and dialogue "
-							"with users",
-				tags=["natural language", "dialog", "conversation"],
-				examples=[
-					"Hello, how are you?",
-					"Can you help me with something?",
-				],
-		)
+		card_key = (self._host, self._port, self._root_path)
+		if self._agent_card is not None and self._card_key == card_key:
+			return self._agent_card
 
 		# Build complete URL: http://{host}:{port}{root_path}
 		# root_path already contains leading /, so concatenate directly
-		url = f"http://{self._host}:{self._port}{self._root_path}"
-		logger.debug(f"[{self.__class__.__name__}] Agent card URL: {url}")
+		url = self._base_agent_url + self._root_path
+		logger.debug("[%s] Agent card URL: %s", self.__class__.__name__, url)
 
+		self._card_key = card_key
 		return AgentCard(
-				capabilities=capabilities,
-				skills=[skill],
+				capabilities=_DEFAULT_CAPABILITIES,
+				skills=[_DIALOG_SKILL],
 				name=self._agent.name,
 				description=self._agent.description,
 				default_input_modes=["text"],
@@ -182,10 +192,10 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 			logger.info(f"[{self.__class__.__name__}] Starting Nacos registration for agent: {self._agent_card.name}")
 			
 			# Get Nacos AI service with connection pooling
-			manager = NacosServiceManager()
-			self.nacos_ai_service = await manager.get_ai_service(
-				self._nacos_client_config
-			)
+			if self.nacos_ai_service is None:
+				self.nacos_ai_service = await NacosServiceManager().get_ai_service(
+					self._nacos_client_config
+				)
 			
 			# Step 1: Publish agent card to Nacos
 			await self.nacos_ai_service.release_agent_card(
@@ -217,9 +227,9 @@ class A2AFastAPINacosAdaptor(ProtocolAdapter):
 		Can be called to ensure registration is finished before proceeding.
 		"""
 		if self._register_task:
-			logger.debug(f"[{self.__class__.__name__}] Waiting for Nacos registration to complete...")
+			logger.debug("[%s] Waiting for Nacos registration to complete...", self.__class__.__name__)
 			await self._register_task
-			logger.debug(f"[{self.__class__.__name__}] Nacos registration completed")
+			logger.debug("[%s] Nacos registration completed", self.__class__.__name__)
 
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -17,6 +18,16 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 	Supports automatic updates when agent cards change in Nacos.
 	"""
 
+	__slots__ = (
+		"_nacos_client_config",
+		"_remote_agent_name",
+		"_version",
+		"_initialized",
+		"_init_lock",
+		"_nacos_ai_service",
+		"_agent_card",
+	)
+
 	def __init__(
 			self,
 			remote_agent_name: str,
@@ -47,6 +58,7 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 
 		# Lazy initialization state
 		self._initialized = False
+		self._init_lock = asyncio.Lock()
 		self._nacos_ai_service: Any | None = None
 		self._agent_card: AgentCard | None = None
 
@@ -61,7 +73,8 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 			RuntimeError:
 				If failed to fetch agent card from Nacos.
 		"""
-		await self._ensure_initialized()
+		if not self._initialized:
+			await self._ensure_initialized()
 
 		if self._agent_card is None:
 			raise RuntimeError(
@@ -74,19 +87,31 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 		"""Ensure the resolver is initialized.
 
 		Performs lazy initialization on first call, including:
-		- Creating NacosAIService
+		- Getting the pooled NacosAIService
 		- Fetching agent card from Nacos
 		- Subscribing to agent card updates
 		"""
 		if self._initialized:
 			return
 
+		# Concurrent first callers queue here and return once the first
+		# one has initialized, instead of each creating a service and
+		# subscription of its own
+		async with self._init_lock:
+			if self._initialized:
+				return
+			await self._initialize()
+
+	async def _initialize(self) -> None:
+		"""Get the Nacos AI service, fetch the card and subscribe to it."""
 		# Lazy import third-party libraries
 		from v2.nacos.ai.model.ai_param import (
 			GetAgentCardParam,
 			SubscribeAgentCardParam,
 		)
-		from v2.nacos.ai.nacos_ai_service import NacosAIService
+
+		from agentscope_extension_nacos.nacos_service_manager import \
+			NacosServiceManager
 
 		try:
 			logger.debug(
@@ -95,8 +120,9 @@ class NacosAgentCardResolver(AgentCardResolverBase):
 					self._remote_agent_name,
 			)
 
-			# Create Nacos AI service
-			self._nacos_ai_service = await NacosAIService.create_ai_service(
+			# Get the pooled Nacos AI service, shared by every resolver
+			# with the same client config
+			self._nacos_ai_service = await NacosServiceManager().get_ai_service(
 					self._nacos_client_config,
 			)
 
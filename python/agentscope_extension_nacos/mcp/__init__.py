@@ -35,22 +35,38 @@ Usage Examples:
     >>> await toolkit.register_mcp_client(client)
 """
 
-from agentscope_extension_nacos.mcp.agentscope_nacos_mcp import (
+import importlib
+
+# Public names are resolved on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
     # Base class
-    NacosMCPClientBase,
+    "NacosMCPClientBase": "agentscope_extension_nacos.mcp.agentscope_nacos_mcp",
     # Stateless clients
-    NacosHttpStatelessClient,
+    "NacosHttpStatelessClient": "agentscope_extension_nacos.mcp.agentscope_nacos_mcp",
     # Stateful clients
-    NacosStatefulClientBase,
-    NacosHttpStatefulClient,
-    NacosStdIOStatefulClient,
-)
+    "NacosStatefulClientBase": "agentscope_extension_nacos.mcp.agentscope_nacos_mcp",
+    "NacosHttpStatefulClient": "agentscope_extension_nacos.mcp.agentscope_nacos_mcp",
+    "NacosStdIOStatefulClient": "agentscope_extension_nacos.mcp.agentscope_nacos_mcp",
+    # Dynamic toolkit
+    "DynamicToolkit": "agentscope_extension_nacos.mcp.agentscope_dynamic_toolkit",
+}
 
-from agentscope_extension_nacos.mcp.agentscope_dynamic_toolkit import (
-    DynamicToolkit,
-)
 
-__all__ = [
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _ALL_SET)
+
+
+__all__ = (
     # Base class
     "NacosMCPClientBase",
     # Stateless clients
@@ -61,4 +77,7 @@ __all__ = [
     "NacosStdIOStatefulClient",
     # Dynamic toolkit
     "DynamicToolkit",
-]
+)
+
+# Membership set for __dir__, built once
+_ALL_SET = frozenset(__all__)
@@ -0,0 +1,19 @@
+from agentscope_extension_nacos.mcp.agentscope_dynamic_toolkit import (
+    DynamicToolkit as DynamicToolkit,
+)
+from agentscope_extension_nacos.mcp.agentscope_nacos_mcp import (
+    NacosHttpStatefulClient as NacosHttpStatefulClient,
+    NacosHttpStatelessClient as NacosHttpStatelessClient,
+    NacosMCPClientBase as NacosMCPClientBase,
+    NacosStatefulClientBase as NacosStatefulClientBase,
+    NacosStdIOStatefulClient as NacosStdIOStatefulClient,
+)
+
+__all__ = (
+    "NacosMCPClientBase",
+    "NacosHttpStatelessClient",
+    "NacosStatefulClientBase",
+    "NacosHttpStatefulClient",
+    "NacosStdIOStatefulClient",
+    "DynamicToolkit",
+)
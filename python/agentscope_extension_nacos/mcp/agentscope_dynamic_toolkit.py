@@ -66,7 +66,7 @@ class DynamicToolkit(Toolkit):
 		# Now safely call parent initialization
 		super().__init__()
 		
-		logger.debug(f"[{self.__class__.__name__}] Initialized")
+		logger.debug("[%s] Initialized", self.__class__.__name__)
 
 	def get_inner_toolkit(self):
 		return self._toolkit
@@ -141,7 +141,7 @@ class DynamicToolkit(Toolkit):
 				old_client = self._nacos_clients[mcp_client.name]
 				if old_client is not mcp_client:
 					old_client._detach_toolkit(self)
-					logger.debug(f"[{self.__class__.__name__}] Detached from old client: {mcp_client.name}")
+					logger.debug("[%s] Detached from old client: %s", self.__class__.__name__, mcp_client.name)
 			
 			# Register new client
 			mcp_client._attach_toolkit(self)
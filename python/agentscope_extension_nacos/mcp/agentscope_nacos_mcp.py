@@ -1,9 +1,12 @@
 import asyncio
 import logging
+import time
 import weakref
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Literal, Optional
 
+import httpx
 import mcp
 from agentscope.mcp import MCPClientBase, MCPToolFunction, StatefulClientBase
 from agentscope.tool import ToolResponse, Toolkit
@@ -11,7 +14,7 @@ from mcp import ClientSession, StdioServerParameters, stdio_client
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
 from v2.nacos import ClientConfig
-from v2.nacos.ai.model.ai_param import GetMcpServerParam, SubscribeMcpServerParam
+from v2.nacos.ai.model.ai_param import SubscribeMcpServerParam
 from v2.nacos.ai.model.mcp.mcp import McpServerDetailInfo
 from v2.nacos.ai.nacos_ai_service import NacosAIService
 
@@ -29,6 +32,48 @@ except ImportError:
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Newer MCP SDKs accept an externally managed httpx client, which lets
+# streamable HTTP sessions share pooled connections
+streamable_http_client: Optional[Callable[..., Any]]
+try:
+	from mcp.client.streamable_http import streamable_http_client
+except ImportError:
+	streamable_http_client = None
+	logger.debug(
+		"mcp.client.streamable_http.streamable_http_client is unavailable, "
+		"streamable HTTP connections will not be pooled")
+
+# streamablehttp_client arguments the pooled streamable HTTP path forwards,
+# configs carrying any other key fall back to streamablehttp_client
+_POOLED_CLIENT_CONFIG_KEYS = frozenset({
+	"headers", "timeout", "sse_read_timeout", "auth", "terminate_on_close",
+})
+
+
+def _find_command_args(config, command_key="command", args_key="args"):
+	"""Find the command and args keys in a nested dictionary.
+	
+	Dictionaries are visited depth-first in key order, a parent before its
+	children, and the first value found for each key wins.
+	"""
+	command_value = None
+	args_value = None
+	stack = [config]
+	while stack:
+		config_dict = stack.pop()
+		if not isinstance(config_dict, dict):
+			continue
+		if command_value is None:
+			command_value = config_dict.get(command_key)
+		if args_value is None:
+			args_value = config_dict.get(args_key)
+		if command_value is not None and args_value is not None:
+			break
+		# Reversed so the first child is visited next
+		stack.extend(reversed(
+			[value for value in config_dict.values() if isinstance(value, dict)]
+		))
+	return command_value, args_value
 
 
 class NacosMCPClientBase(MCPClientBase, ABC):
@@ -50,6 +95,10 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		nacos_client_config: Optional Nacos client config (uses global if None)
 	"""
 
+	tools_cache_ttl: float = 30.0
+	"""Seconds list_tools reuses the fetched tool list, 0 disables the
+	cache. Nacos updates of the server invalidate it immediately."""
+
 	def __init__(
 		self,
 		name: str,
@@ -61,19 +110,25 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		self.nacos_ai_service: NacosAIService | None = None
 		self.mcp_server_detail_info: McpServerDetailInfo | None = None
 		self._tools: List[mcp.types.Tool] = []
+		self._tools_by_name: dict[str, mcp.types.Tool] = {}
+		self._tools_cache_expiry: float = 0.0
+		# Server detail info last merged into _tools by update_tools
+		self._applied_detail_info: McpServerDetailInfo | None = None
 		self._tools_meta = {}
+		# Names of tools explicitly disabled in _tools_meta
+		self._disabled_tools: frozenset[str] = frozenset()
 		
 		# Use weak reference set to store Toolkit observers, avoiding circular references
 		self._toolkit_refs: weakref.WeakSet['Toolkit'] = weakref.WeakSet()
-		self._update_lock = asyncio.Lock()
-		self._is_updating = False  # Flag to prevent recursive updates
+		# Toolkit sync in flight, and whether another update arrived meanwhile
+		self._notify_task: asyncio.Task | None = None
+		self._notify_pending = False
 		
 		# Lazy initialization state
 		self._initialized = False
-		self._initializing = False
 		self._init_lock = asyncio.Lock()
 		
-		logger.debug(f"[{self.__class__.__name__}] Initialized for MCP server: {name}")
+		logger.debug("[%s] Initialized for MCP server: %s", self.__class__.__name__, name)
 
 
 	async def _ensure_initialized(self):
@@ -85,18 +140,13 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		if self._initialized:
 			return
 		
-		# Wait if initialization is in progress
-		if self._initializing:
-			while self._initializing:
-				await asyncio.sleep(0.01)
-			return
-		
+		# Concurrent callers queue on the lock and see the result of the
+		# first initialization once it is released
 		async with self._init_lock:
 			# Double-check to avoid duplicate initialization
 			if self._initialized:
 				return
 			
-			self._initializing = True
 			try:
 				logger.info(f"[{self.__class__.__name__}] Initializing MCP client for: {self.name}")
 				await self._async_init()
@@ -105,29 +155,17 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 			except Exception as e:
 				logger.error(f"[{self.__class__.__name__}] Failed to initialize: {e}")
 				raise
-			finally:
-				self._initializing = False
 	
 	async def _async_init(self):
 		"""Internal async initialization logic.
 		
-		Fetches MCP server details from Nacos and subscribes to updates.
-		Uses NacosServiceManager for connection pooling.
+		Subscribes to MCP server updates in Nacos, which also returns the
+		current server details. Uses NacosServiceManager for connection pooling.
 		"""
 		# Get Nacos AI service with connection pooling
 		manager = NacosServiceManager()
 		self.nacos_ai_service = await manager.get_ai_service(
 			self._nacos_client_config)
-		
-		# Fetch MCP server details from Nacos
-		self.mcp_server_detail_info = await self.nacos_ai_service.get_mcp_server(
-				GetMcpServerParam(
-						mcp_name=self.name,
-				))
-		
-		if self.mcp_server_detail_info is None or self.mcp_server_detail_info.frontProtocol not in self.get_supported_transport():
-			logger.error(f"[{self.__class__.__name__}] Invalid MCP server detail info for: {self.name}")
-			raise ValueError("MCP server detail info is None or unsupported transport")
 
 		# Callback for MCP server updates from Nacos
 		async def callback(mcp_id, namespace_id, mcp_name,
@@ -135,20 +173,36 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 			"""Handle MCP server detail updates from Nacos."""
 			logger.info(f"[{self.__class__.__name__}] MCP server updated: {mcp_name}")
 			self.mcp_server_detail_info = mcp_server_detail_info
+			# Refetch the tool list on the next list_tools call
+			self._tools_cache_expiry = 0.0
 			changed = self.update_tools(mcp_server_detail_info)
 			if changed and self._toolkit_refs:
-				logger.debug(f"[{self.__class__.__name__}] Tools changed, notifying toolkits")
-				asyncio.create_task(self._notify_toolkits())
+				logger.debug("[%s] Tools changed, notifying toolkits", self.__class__.__name__)
+				self._schedule_notify_toolkits()
 
 		self.subscribe_param = SubscribeMcpServerParam(
 				mcp_name=self.name,
 				subscribe_callback=callback,
 		)
 
-		await self.nacos_ai_service.subscribe_mcp_server(
-				self.subscribe_param
-		)
-		logger.debug(f"[{self.__class__.__name__}] Subscribed to MCP server updates for: {self.name}")
+		# The subscription answers from the SDK's cache when another client
+		# already subscribed to this server, so no separate query is needed.
+		# The SDK registers the callback before querying, so it has to be
+		# removed again on any failure, or every retry would leak one
+		try:
+			self.mcp_server_detail_info = await self.nacos_ai_service.subscribe_mcp_server(
+					self.subscribe_param
+			)
+			if self.mcp_server_detail_info is None or self.mcp_server_detail_info.frontProtocol not in self.get_supported_transport():
+				logger.error(f"[{self.__class__.__name__}] Invalid MCP server detail info for: {self.name}")
+				raise ValueError("MCP server detail info is None or unsupported transport")
+		except BaseException:
+			try:
+				await self.nacos_ai_service.unsubscribe_mcp_server(self.subscribe_param)
+			except Exception as e:
+				logger.warning(f"[{self.__class__.__name__}] Failed to unsubscribe from MCP server {self.name}: {e}")
+			raise
+		logger.debug("[%s] Subscribed to MCP server updates for: %s", self.__class__.__name__, self.name)
 	
 	async def initialize(self):
 		"""Public initialization method (backward compatible).
@@ -211,26 +265,37 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		
 		Unified processing: init check → get tools → cache → update → filter
 		
+		The raw tool list is reused for ``tools_cache_ttl`` seconds.
+		
 		Returns:
 			List of enabled tools
 		"""
 		# 1. Ensure initialization
 		await self._ensure_initialized()
 		
-		# 2. Call subclass implementation to get raw tool list
-		tools = await self._list_tools_impl()
-		logger.debug(f"[{self.__class__.__name__}] Fetched {len(tools)} tools from MCP server")
-		
-		# 3. Cache tools
-		self._tools = tools
+		# 2. Call subclass implementation to get raw tool list, unless the
+		# cached one is still fresh
+		now = time.monotonic()
+		if self._tools and now < self._tools_cache_expiry:
+			tools = self._tools
+		else:
+			tools = await self._list_tools_impl()
+			logger.debug("[%s] Fetched %d tools from MCP server", self.__class__.__name__, len(tools))
+			
+			# 3. Cache tools
+			self._tools = tools
+			self._tools_by_name = {tool.name: tool for tool in tools}
+			self._applied_detail_info = None
+			self._tools_cache_expiry = now + self.tools_cache_ttl
 		
 		# 4. Update tool metadata
 		self.update_tools(self.mcp_server_detail_info)
 		
 		# 5. Return enabled tools only
+		disabled_tools = self._disabled_tools
 		enabled_tools = [
 			tool for tool in self._tools if
-			self.is_tool_enabled(tool.name)
+			tool.name not in disabled_tools
 		]
 		logger.info(f"[{self.__class__.__name__}] {len(enabled_tools)} tools enabled out of {len(tools)}")
 		return enabled_tools
@@ -262,13 +327,8 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 			await self.list_tools()
 		
 		# 3. Find the target tool
-		target_tool = None
-		for tool in self._tools:
-			if tool.name == func_name and self.is_tool_enabled(tool.name):
-				target_tool = tool
-				break
-		
-		if target_tool is None:
+		target_tool = self._tools_by_name.get(func_name)
+		if target_tool is None or not self.is_tool_enabled(func_name):
 			raise ValueError(
 				f"Tool '{func_name}' not found in the MCP server '{self.name}'"
 			)
@@ -301,49 +361,64 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		except KeyError:
 			pass  # Toolkit has already been removed or garbage collected
 	
+	def _schedule_notify_toolkits(self) -> None:
+		"""Schedule a toolkit sync, coalescing bursts of updates.
+		
+		If a sync is already running it is only asked to run once more
+		when done, so no update is lost and at most one sync is queued.
+		"""
+		self._notify_pending = True
+		if self._notify_task is None or self._notify_task.done():
+			self._notify_task = asyncio.create_task(
+				self._notify_toolkits(),
+				name=f"nacos-mcp-notify-{self.name}",
+			)
+	
 	async def _notify_toolkits(self) -> None:
 		"""Notify all registered Toolkits and re-synchronize tools when tools are updated.
 		
-		Uses a flag to avoid recursive calls.
+		Toolkits are synchronized concurrently. Updates arriving during a
+		sync trigger one more round instead of being dropped.
 		"""
-		# If updating, return directly to avoid recursion
-		if self._is_updating:
-			return
-		
-		# Get all current toolkit references (weak reference set may change during iteration)
-		toolkits = list(self._toolkit_refs)
-		
-		if not toolkits:
-			return
-		
-		async with self._update_lock:
-			self._is_updating = True
-			try:
-				logger.info(
-					f"Notifying {len(toolkits)} toolkit(s) about "
-					f"tool changes in MCP client '{self.name}'"
-				)
-				
-				for toolkit in toolkits:
-					try:
-						# Use parent Toolkit methods to avoid triggering DynamicToolkit's extra logic
-						# First remove old tools
-						await Toolkit.remove_mcp_clients(toolkit, [self.name])
-						
-						# Re-register new tools
-						await Toolkit.register_mcp_client(toolkit, self)
-						
-						logger.info(
-							f"Toolkit synchronized with MCP client '{self.name}'"
-						)
-					except Exception as e:
-						logger.error(
-							f"Failed to sync toolkit with MCP client "
-							f"'{self.name}': {e}",
-							exc_info=True
-						)
-			finally:
-				self._is_updating = False
+		while True:
+			self._notify_pending = False
+			
+			# Get all current toolkit references (weak reference set may change during iteration)
+			toolkits = list(self._toolkit_refs)
+			
+			if not toolkits:
+				return
+			
+			logger.info(
+				f"Notifying {len(toolkits)} toolkit(s) about "
+				f"tool changes in MCP client '{self.name}'"
+			)
+			await asyncio.gather(
+				*(self._sync_toolkit(toolkit) for toolkit in toolkits)
+			)
+			
+			if not self._notify_pending:
+				return
+	
+	async def _sync_toolkit(self, toolkit: 'Toolkit') -> None:
+		"""Re-register this client's tools in one Toolkit."""
+		try:
+			# Use parent Toolkit methods to avoid triggering DynamicToolkit's extra logic
+			# First remove old tools
+			await Toolkit.remove_mcp_clients(toolkit, [self.name])
+			
+			# Re-register new tools
+			await Toolkit.register_mcp_client(toolkit, self)
+			
+			logger.info(
+				f"Toolkit synchronized with MCP client '{self.name}'"
+			)
+		except Exception as e:
+			logger.error(
+				f"Failed to sync toolkit with MCP client "
+				f"'{self.name}': {e}",
+				exc_info=True
+			)
 	
 	def _check_tools_changed(
 		self, 
@@ -377,18 +452,20 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 	def update_tools(self, server_detail_info: McpServerDetailInfo) -> bool:
 		"""Update tool information and automatically notify all registered Toolkits when tools change."""
 		
+		# Nothing to merge if this detail info was already applied to the
+		# current tool list
+		if server_detail_info is self._applied_detail_info:
+			return False
+		tools_changed = self._merge_tools(server_detail_info)
+		self._applied_detail_info = server_detail_info
+		return tools_changed
+
+	def _merge_tools(self, server_detail_info: McpServerDetailInfo) -> bool:
+		"""Merge Nacos tool metadata and descriptions into the tool list."""
+		
 		# Check if tools have changed (check before updating)
 		tools_changed = self._check_tools_changed(server_detail_info)
 
-		def update_args_description(_local_args: dict[str, Any],
-				_nacos_args: dict[str, Any]):
-			nonlocal tools_changed
-			for key, value in _local_args.items():
-				if key in _nacos_args and "description" in _nacos_args[key] and value["description"] != _nacos_args[key]["description"]:
-					tools_changed = True
-					_local_args[key]["description"] = _nacos_args[key][
-						"description"]
-
 		tool_spec = server_detail_info.toolSpec
 		if tool_spec is None:
 			return tools_changed
@@ -396,31 +473,37 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 			self._tools_meta = {}
 		else:
 			self._tools_meta = tool_spec.toolsMeta
+		# Decide the enabled state once per metadata update
+		self._disabled_tools = frozenset(
+			name for name, meta in self._tools_meta.items()
+			if meta.enabled is not None and not meta.enabled
+		)
 		if tool_spec.tools is None:
 			return tools_changed
+		tools_by_name = self._tools_by_name
 		for tool in tool_spec.tools:
-			for self_tool in self._tools:
-				if self_tool.name == tool.name:
-					if tool.description is not None and self_tool.description != tool.description:
-						self_tool.description = tool.description
-						tools_changed = True
-					local_args = self_tool.inputSchema["properties"]
-					nacos_args = tool.inputSchema["properties"]
-					update_args_description(local_args, nacos_args)
-					break
-
+			self_tool = tools_by_name.get(tool.name)
+			if self_tool is None:
+				continue
+			if tool.description is not None and self_tool.description != tool.description:
+				self_tool.description = tool.description
+				tools_changed = True
+			# Apply Nacos argument descriptions to the matching local arguments
+			local_args = self_tool.inputSchema["properties"]
+			for key, nacos_arg in tool.inputSchema["properties"].items():
+				local_arg = local_args.get(key)
+				if (
+					local_arg is not None
+					and "description" in nacos_arg
+					and local_arg.get("description") != nacos_arg["description"]
+				):
+					local_arg["description"] = nacos_arg["description"]
+					tools_changed = True
 
 		return tools_changed
 
 	def is_tool_enabled(self, tool_name: str) -> bool:
-		if self._tools_meta is None:
-			return True
-		if tool_name in self._tools_meta:
-			mcp_tool_meta = self._tools_meta[tool_name]
-			if mcp_tool_meta.enabled is not None:
-				if not mcp_tool_meta.enabled:
-					return False
-		return True
+		return tool_name not in self._disabled_tools
 
 	async def shutdown(self):
 		pass
@@ -437,6 +520,7 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 		- No persistent connection overhead
 		- Simple lifecycle management
 		- Automatic cleanup after each operation
+		- Keep-alive HTTP connections reused across streamable HTTP calls
 	"""
 	
 	stateful: bool = False
@@ -459,6 +543,8 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 			"sse_read_timeout": sse_read_timeout,
 			**client_kwargs,
 		}
+		# Pooled HTTP client for the streamable transport, created on first use
+		self._http_client: httpx.AsyncClient | None = None
 
 	def get_supported_transport(self) -> List[str]:
 		return ["mcp-sse", "mcp-streamable"]
@@ -491,6 +577,18 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 				raise
 
 		if transport == "mcp-streamable":
+			if (
+				streamable_http_client is not None
+				and self.client_config.keys() <= _POOLED_CLIENT_CONFIG_KEYS
+			):
+				# Each call still opens its own MCP session, but over the
+				# kept-alive connections of one shared HTTP client
+				return streamable_http_client(
+					url,
+					http_client=self._get_http_client(),
+					terminate_on_close=self.client_config.get(
+						"terminate_on_close", True),
+				)
 			return streamablehttp_client(**config_with_url)
 
 		raise ValueError(
@@ -498,6 +596,32 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 				"Supported types are 'sse' and 'streamable_http'.",
 		)
 	
+	def _get_http_client(self) -> httpx.AsyncClient:
+		"""Get the pooled HTTP client, configured like streamablehttp_client would."""
+		if self._http_client is None or self._http_client.is_closed:
+			config = self.client_config
+			timeout = config["timeout"]
+			sse_read_timeout = config["sse_read_timeout"]
+			if isinstance(timeout, timedelta):
+				timeout = timeout.total_seconds()
+			if isinstance(sse_read_timeout, timedelta):
+				sse_read_timeout = sse_read_timeout.total_seconds()
+			# Redirects are left to the MCP transport, which only follows
+			# them within the endpoint's origin
+			self._http_client = httpx.AsyncClient(
+				headers=config["headers"],
+				timeout=httpx.Timeout(timeout, read=sse_read_timeout),
+				auth=config.get("auth"),
+				follow_redirects=False,
+			)
+		return self._http_client
+
+	async def shutdown(self):
+		if self._http_client is not None:
+			await self._http_client.aclose()
+			self._http_client = None
+		await super().shutdown()
+	
 	# ============================================================================
 	# Implement abstract methods: Only responsible for low-level operations, not handling initialization and caching
 	# ============================================================================
@@ -667,46 +791,8 @@ class NacosStdIOStatefulClient(NacosStatefulClientBase):
 		await super()._async_init()
 		local_server_config = self.mcp_server_detail_info.localServerConfig
 
-		# Recursively find command and args keys
-		def find_command_args(config_dict, command_key="command",
-				args_key="args"):
-			"""
-			Recursively find command and args keys in nested dictionary
-			"""
-			if not isinstance(config_dict, dict):
-				return None, None
-
-			command_value = None
-			args_value = None
-
-			# Check if the current level has command or args keys
-			if command_key in config_dict:
-				command_value = config_dict[command_key]
-
-			if args_key in config_dict:
-				args_value = config_dict[args_key]
-
-			# If both values are found at the current level, return directly
-			if command_value is not None and args_value is not None:
-				return command_value, args_value
-
-			# Otherwise, recursively check each level
-			for key, value in config_dict.items():
-				if isinstance(value, dict):
-					cmd, args = find_command_args(value, command_key, args_key)
-					if cmd is not None and command_value is None:
-						command_value = cmd
-					if args is not None and args_value is None:
-						args_value = args
-
-					# If both are found, terminate early
-					if command_value is not None and args_value is not None:
-						break
-
-			return command_value, args_value
-
 		# Find command and args
-		command, args = find_command_args(local_server_config)
+		command, args = _find_command_args(local_server_config)
 
 		self.client = stdio_client(
 				StdioServerParameters(
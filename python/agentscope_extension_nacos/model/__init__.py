@@ -35,12 +35,33 @@ Usage Examples:
     >>> response = await model(messages)
 """
 
-from agentscope_extension_nacos.model.nacos_chat_model import (
-    NacosChatModel,
-    AutoFormatter,
-)
+import importlib
+
+# Public names are resolved on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "NacosChatModel": "agentscope_extension_nacos.model.nacos_chat_model",
+    "AutoFormatter": "agentscope_extension_nacos.model.nacos_chat_model",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
-__all__ = [
+def __dir__():
+    return sorted(set(globals()) | _ALL_SET)
+
+
+__all__ = (
     "NacosChatModel",
     "AutoFormatter",
-]
+)
+
+# Membership set for __dir__, built once
+_ALL_SET = frozenset(__all__)
@@ -0,0 +1,9 @@
+from agentscope_extension_nacos.model.nacos_chat_model import (
+    AutoFormatter as AutoFormatter,
+    NacosChatModel as NacosChatModel,
+)
+
+__all__ = (
+    "NacosChatModel",
+    "AutoFormatter",
+)
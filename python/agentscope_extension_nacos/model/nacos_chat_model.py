@@ -28,7 +28,7 @@ from agentscope.model import (
 from v2.nacos import ClientConfig, ConfigParam, NacosConfigService
 
 from agentscope_extension_nacos.nacos_service_manager import NacosServiceManager
-from agentscope_extension_nacos.utils import AsyncRWLock, validate_agent_name
+from agentscope_extension_nacos.utils import validate_agent_name
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -75,7 +75,6 @@ class NacosChatModel(ChatModelBase):
 	):
 		# Lazy initialization state flags
 		self._initialized = False
-		self._initializing = False
 		self._init_lock = asyncio.Lock()
 		
 		self.client_args = client_args or {}
@@ -84,7 +83,9 @@ class NacosChatModel(ChatModelBase):
 		self._nacos_client_config: Optional[ClientConfig] = nacos_client_config
 		self.nacos_config_service: NacosConfigService | None = None
 		self.chat_model: ChatModelBase | None = None
-		self.model_lock = AsyncRWLock()
+		# Serializes writers only; readers take a reference to chat_model,
+		# which is always swapped in as a whole
+		self.model_lock = asyncio.Lock()
 
 		self.api_key: str | None = None
 		self.args: dict = {}
@@ -93,7 +94,7 @@ class NacosChatModel(ChatModelBase):
 		self.base_url = ""
 		self._backup_model: ChatModelBase | None = backup_model
 		
-		logger.debug(f"[{self.__class__.__name__}] Initialized for agent: {agent_name}")
+		logger.debug("[%s] Initialized for agent: %s", self.__class__.__name__, agent_name)
 
 	async def _ensure_initialized(self):
 		"""Ensure ChatModel is initialized (thread-safe lazy initialization).
@@ -103,18 +104,13 @@ class NacosChatModel(ChatModelBase):
 		if self._initialized:
 			return
 		
-		# If initializing, wait for completion
-		if self._initializing:
-			while self._initializing:
-				await asyncio.sleep(0.01)
-			return
-		
+		# Concurrent callers queue on the lock and see the result of the
+		# first initialization once it is released
 		async with self._init_lock:
 			# Double-check to avoid duplicate initialization
 			if self._initialized:
 				return
 			
-			self._initializing = True
 			try:
 				logger.info(f"[{self.__class__.__name__}] Starting initialization for agent: {self.agent_name}")
 				await self._async_init()
@@ -123,8 +119,6 @@ class NacosChatModel(ChatModelBase):
 			except Exception as e:
 				logger.error(f"[{self.__class__.__name__}] Initialization failed for agent {self.agent_name}: {e}", exc_info=True)
 				raise
-			finally:
-				self._initializing = False
 	
 	async def _async_init(self):
 		"""Internal async initialization logic.
@@ -135,7 +129,7 @@ class NacosChatModel(ChatModelBase):
 		manager = NacosServiceManager()
 		self.nacos_config_service = await manager.get_config_service(
 			self._nacos_client_config)
-		logger.debug(f"[{self.__class__.__name__}] Obtained Nacos config service for agent: {self.agent_name}")
+		logger.debug("[%s] Obtained Nacos config service for agent: %s", self.__class__.__name__, self.agent_name)
 
 		user_model_config_group_name = f"ai-agent-{self.agent_name}"
 		user_model_config_data_id = "model.json"
@@ -198,7 +192,7 @@ class NacosChatModel(ChatModelBase):
 				data_id=user_model_config_data_id,
 				group=user_model_config_group_name,
 				listener=user_model_config_listener)
-		logger.debug(f"[{self.__class__.__name__}] Registered user model config listener")
+		logger.debug("[%s] Registered user model config listener", self.__class__.__name__)
 	
 	async def initialize(self):
 		"""Public initialization method (maintains backward compatibility).
@@ -257,12 +251,15 @@ class NacosChatModel(ChatModelBase):
 	async def set_chat_model(self, chat_model: ChatModelBase):
 		"""Set the chat model (thread-safe).
 		
+		The new model replaces the old one in a single assignment, so
+		in-flight calls keep the model they started with.
+		
 		Args:
 			chat_model: The chat model instance to set
 		"""
-		async with self.model_lock.write_lock():
+		async with self.model_lock:
 			self.chat_model = chat_model
-			logger.debug(f"[{self.__class__.__name__}] Chat model updated")
+			logger.debug("[%s] Chat model updated", self.__class__.__name__)
 
 	def set_backup_model(self, backup_model: ChatModelBase):
 		"""Set the backup model to use when primary model fails.
@@ -272,7 +269,7 @@ class NacosChatModel(ChatModelBase):
 		"""
 		if backup_model is not self:
 			self._backup_model = backup_model
-			logger.debug(f"[{self.__class__.__name__}] Backup model set")
+			logger.debug("[%s] Backup model set", self.__class__.__name__)
 
 	async def get_chat_model(self) -> ChatModelBase:
 		"""Get the chat model instance.
@@ -283,8 +280,7 @@ class NacosChatModel(ChatModelBase):
 			ChatModelBase: The current chat model instance
 		"""
 		await self._ensure_initialized()
-		async with self.model_lock.read_lock():
-			return self.chat_model
+		return self.chat_model
 	
 	# ============================================================================
 	# Override key methods to implement lazy initialization
@@ -308,15 +304,15 @@ class NacosChatModel(ChatModelBase):
 		"""
 		await self._ensure_initialized()
 		# Directly access chat_model to avoid calling _ensure_initialized again in get_chat_model
-		async with self.model_lock.read_lock():
-			return await self.chat_model(*args, **kwargs)
+		chat_model = self.chat_model
+		return await chat_model(*args, **kwargs)
 
 	async def close(self):
 		"""Close connection and clean up resources"""
 		if self.nacos_config_service:
 			logger.info(f"[{self.__class__.__name__}] Closing Nacos config service for agent: {self.agent_name}")
 			await self.nacos_config_service.shutdown()
-			logger.debug(f"[{self.__class__.__name__}] Nacos config service closed")
+			logger.debug("[%s] Nacos config service closed", self.__class__.__name__)
 
 
 class AutoFormatter(FormatterBase):
@@ -1,10 +1,12 @@
 import asyncio
 import json
 import logging
-from typing import Literal, Optional
+from contextvars import ContextVar
+from typing import Any, Literal, Optional
 
 from agentscope.agent import ReActAgent
 from agentscope.memory import LongTermMemoryBase, MemoryBase
+from agentscope.message import Msg
 from agentscope.plan import PlanNotebook
 from agentscope.rag import KnowledgeBase
 from agentscope.tool import Toolkit
@@ -19,6 +21,24 @@ from agentscope_extension_nacos.nacos_service_manager import NacosServiceManager
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Prompt pinned for the reply currently running in this context, as
+# (agent, prompt). Keyed by agent so nested agent calls are unaffected.
+_reply_prompt: ContextVar[tuple["NacosReActAgent", str] | None] = ContextVar(
+	"nacos_reply_prompt", default=None)
+
+
+async def _gather_or_raise(*aws):
+	"""Await all awaitables concurrently and return their results in order.
+
+	Every awaitable runs to completion before the first failure (if any) is
+	re-raised, so no half-finished fetch is left running in the background.
+	"""
+	results = await asyncio.gather(*aws, return_exceptions=True)
+	for result in results:
+		if isinstance(result, BaseException):
+			raise result
+	return results
+
 
 class NacosAgentListener:
 	"""Nacos Agent Listener - Supports lazy initialization and background pre-initialization.
@@ -47,6 +67,33 @@ class NacosAgentListener:
 		agent = NacosReActAgent(nacos_agent_listener=listener, name="my_agent")
 		```
 	"""
+
+	__slots__ = (
+		"_nacos_client_config",
+		"agent_name",
+		"_listen_prompt",
+		"_listen_mcp_server",
+		"_listen_chat_model",
+		"nacos_config_service",
+		"nacos_ai_service",
+		"toolkit",
+		"chat_model",
+		"formatter",
+		"agent",
+		"mcp_servers",
+		"mcp_server_clients",
+		"user_prompt_ref",
+		"template",
+		"prompt",
+		"_initialized",
+		"_init_lock",
+		"_init_task",
+		"_original_model",
+		"_original_formatter",
+		"_original_prompt",
+		"_original_toolkit",
+		"__weakref__",
+	)
 	
 	def __init__(
 		self,
@@ -61,7 +108,6 @@ class NacosAgentListener:
 		self.agent_name = agent_name
 		self._listen_prompt = listen_prompt
 		self._listen_mcp_server = listen_mcp_server
-		self._listen_mcp_server = listen_mcp_server
 		self._listen_chat_model = listen_chat_model
 		
 		# Nacos services (lazy initialization)
@@ -85,7 +131,6 @@ class NacosAgentListener:
 		
 		# Lazy initialization state
 		self._initialized = False
-		self._initializing = False
 		self._init_lock = asyncio.Lock()
 		self._init_task = None  # For storing pre-initialization task
 
@@ -94,7 +139,7 @@ class NacosAgentListener:
 		self._original_prompt = None
 		self._original_toolkit = None
 		
-		logger.debug(f"[{self.__class__.__name__}] Initialized for agent: {agent_name}")
+		logger.debug("[%s] Initialized for agent: %s", self.__class__.__name__, agent_name)
 		
 		# Try to start background pre-initialization
 		self._try_start_background_init()
@@ -110,11 +155,11 @@ class NacosAgentListener:
 			loop = asyncio.get_running_loop()
 			# If yes, start pre-initialization
 			self._init_task = loop.create_task(self._ensure_initialized())
-			logger.debug(f"[{self.__class__.__name__}] Started background pre-initialization for agent: {self.agent_name}")
+			logger.debug("[%s] Started background pre-initialization for agent: %s", self.__class__.__name__, self.agent_name)
 		except RuntimeError:
 			# No running event loop, skip pre-initialization
 			# This is normal, will use lazy initialization
-			logger.debug(f"[{self.__class__.__name__}] No event loop available, will use lazy initialization for agent: {self.agent_name}")
+			logger.debug("[%s] No event loop available, will use lazy initialization for agent: %s", self.__class__.__name__, self.agent_name)
 			pass
 	
 	async def initialize(self):
@@ -144,18 +189,13 @@ class NacosAgentListener:
 		if self._initialized:
 			return
 
-		# If initializing, wait for completion
-		if self._initializing:
-			while self._initializing:
-				await asyncio.sleep(0.01)
-			return
-
+		# Concurrent callers queue on the lock and see the result of the
+		# first initialization once it is released
 		async with self._init_lock:
 			# Double-check to avoid duplicate initialization
 			if self._initialized:
 				return
 
-			self._initializing = True
 			try:
 				logger.info(f"[{self.__class__.__name__}] Starting initialization for agent: {self.agent_name}")
 				await self._async_init()
@@ -164,8 +204,6 @@ class NacosAgentListener:
 			except Exception as e:
 				logger.error(f"[{self.__class__.__name__}] Initialization failed for agent {self.agent_name}: {e}", exc_info=True)
 				raise
-			finally:
-				self._initializing = False
 
 	async def _async_init(self):
 		"""Internal async initialization logic.
@@ -177,35 +215,40 @@ class NacosAgentListener:
 		"""
 		# Use NacosServiceManager to get services (automatically reuses connections)
 		manager = NacosServiceManager()
-		self.nacos_config_service = await manager.get_config_service(
-			self._nacos_client_config)
-		self.nacos_ai_service = await manager.get_ai_service(
-			self._nacos_client_config)
-		logger.debug(f"[{self.__class__.__name__}] Obtained Nacos services for agent: {self.agent_name}")
+		self.nacos_config_service, self.nacos_ai_service = await _gather_or_raise(
+			manager.get_config_service(self._nacos_client_config),
+			manager.get_ai_service(self._nacos_client_config),
+		)
+		logger.debug("[%s] Obtained Nacos services for agent: %s", self.__class__.__name__, self.agent_name)
 
+		# Chat model, MCP servers and prompt are independent of each other,
+		# so fetch them concurrently instead of paying one round trip each
+		pending = []
 		if self._listen_chat_model:
-			self.chat_model = NacosChatModel(
-				nacos_client_config=self._nacos_client_config,
-				agent_name=self.agent_name,
-				stream=True,
-			)
-			await self.chat_model.initialize()
-
-		
-			self.formatter = AutoFormatter(if_multi_agent=False,
-									  chat_model=self.chat_model)
-			logger.debug(f"[{self.__class__.__name__}] Formatter and Chat model initialized")
+			pending.append(self._init_chat_model())
 		if self._listen_mcp_server:
 			self.toolkit = DynamicToolkit()
-			logger.debug(f"[{self.__class__.__name__}] Toolkit created")
-
-			await self._init_listen_mcp_server()
-
+			logger.debug("[%s] Toolkit created", self.__class__.__name__)
+			pending.append(self._init_listen_mcp_server())
 		if self._listen_prompt:
-			await self._init_listen_prompt()
+			pending.append(self._init_listen_prompt())
+		await _gather_or_raise(*pending)
 
 		logger.info(f"[{self.__class__.__name__}] Listeners configured for agent: {self.agent_name}")
 
+	async def _init_chat_model(self):
+		"""Create the Nacos chat model and its formatter."""
+		self.chat_model = NacosChatModel(
+			nacos_client_config=self._nacos_client_config,
+			agent_name=self.agent_name,
+			stream=True,
+		)
+		await self.chat_model.initialize()
+
+		self.formatter = AutoFormatter(if_multi_agent=False,
+								  chat_model=self.chat_model)
+		logger.debug("[%s] Formatter and Chat model initialized", self.__class__.__name__)
+
 
 	async def _init_listen_prompt(self):
 		"""Initialize prompt configuration and set up listeners.
@@ -221,7 +264,7 @@ class NacosAgentListener:
 			_user_prompt_dict = json.loads(content)
 			self.template = _user_prompt_dict["template"]
 			self._set_prompt(self.template)
-			logger.debug(f"[{self.__class__.__name__}] Prompt updated")
+			logger.debug("[%s] Prompt updated", self.__class__.__name__)
 
 		async def user_prompt_config_listener(tenant, data_id, group, content):
 			"""Listener for prompt reference changes"""
@@ -254,7 +297,9 @@ class NacosAgentListener:
 							group="nacos-ai-prompt",
 							listener=user_prompt_listener)
 					logger.debug(
-						f"[{self.__class__.__name__}] Updated prompt listener")
+						"[%s] Updated prompt listener",
+						self.__class__.__name__,
+					)
 				if "promptRef" not in _user_prompt_config_dict:
 					if len(_old_prompt_ref) != 0:
 						await self.nacos_config_service.remove_listener(
@@ -285,15 +330,17 @@ class NacosAgentListener:
 					listener=user_prompt_config_listener
 			)
 			logger.debug(
-				f"[{self.__class__.__name__}] Registered prompt config listener")
+				"[%s] Registered prompt config listener",
+				self.__class__.__name__,
+			)
 			return
 
 		user_prompt_config_dict = json.loads(user_prompt_config)
 		if "promptRef" in user_prompt_config_dict:
-			logger.debug(f"[{self.__class__.__name__}] Prompt ref found in config")
+			logger.debug("[%s] Prompt ref found in config", self.__class__.__name__)
 
 			self.user_prompt_ref = user_prompt_config_dict["promptRef"]
-			logger.debug(f"[{self.__class__.__name__}] Loaded prompt ref: {self.user_prompt_ref}")
+			logger.debug("[%s] Loaded prompt ref: %s", self.__class__.__name__, self.user_prompt_ref)
 
 			user_prompt = await self.nacos_config_service.get_config(ConfigParam(
 					data_id=self.user_prompt_ref,
@@ -315,7 +362,9 @@ class NacosAgentListener:
 					listener=user_prompt_listener
 			)
 			logger.debug(
-				f"[{self.__class__.__name__}] Registered prompt content listener")
+				"[%s] Registered prompt content listener",
+				self.__class__.__name__,
+			)
 
 			await self.nacos_config_service.add_listener(
 					data_id=user_prompt_config_data_id,
@@ -323,7 +372,9 @@ class NacosAgentListener:
 					listener=user_prompt_config_listener
 			)
 			logger.debug(
-				f"[{self.__class__.__name__}] Registered prompt config listener")
+				"[%s] Registered prompt config listener",
+				self.__class__.__name__,
+			)
 
 		elif "prompt" in user_prompt_config_dict:
 			self.user_prompt_ref = ""
@@ -336,7 +387,9 @@ class NacosAgentListener:
 					listener=user_prompt_config_listener
 			)
 			logger.debug(
-				f"[{self.__class__.__name__}] Registered prompt config listener")
+				"[%s] Registered prompt config listener",
+				self.__class__.__name__,
+			)
 			return
 		else:
 			logger.error(f"[{self.__class__.__name__}] Invalid prompt config: {user_prompt_config}")
@@ -367,20 +420,20 @@ class NacosAgentListener:
 		
 		if self._listen_prompt:
 			self.agent._sys_prompt = self.prompt
-			logger.debug(f"[{self.__class__.__name__}] Prompt configured for agent")
+			logger.debug("[%s] Prompt configured for agent", self.__class__.__name__)
 			
 		if self._listen_mcp_server:
 			if self.agent.toolkit is not None:
 				self.toolkit.tools.update(self.agent.toolkit.tools)
 				self.toolkit.groups.update(self.agent.toolkit.groups)
 				self.agent.toolkit = self.toolkit
-			logger.debug(f"[{self.__class__.__name__}] Toolkit configured for agent")
+			logger.debug("[%s] Toolkit configured for agent", self.__class__.__name__)
 			
 		if self._listen_chat_model:
 			self.chat_model.set_backup_model(self._original_model)
 			self.agent.model = self.chat_model
 			self.agent.formatter = self.formatter
-			logger.debug(f"[{self.__class__.__name__}] Chat model configured for agent")
+			logger.debug("[%s] Chat model configured for agent", self.__class__.__name__)
 		
 		logger.info(f"[{self.__class__.__name__}] Agent '{agent.name}' successfully attached")
 
@@ -422,18 +475,20 @@ class NacosAgentListener:
 
 		user_mcp_server_config_dict = json.loads(user_mcp_server_config)
 		self.mcp_servers = user_mcp_server_config_dict["mcpServers"]
-		logger.debug(f"[{self.__class__.__name__}] Loaded {len(self.mcp_servers)} MCP server(s) from config")
+		logger.debug("[%s] Loaded %d MCP server(s) from config", self.__class__.__name__, len(self.mcp_servers))
 
-		for mcp_server_dict in self.mcp_servers:
-			mcp_server_name = mcp_server_dict["mcpServerName"]
-			logger.debug(f"[{self.__class__.__name__}] Initializing MCP client: {mcp_server_name}")
-			
-			mcp_stateless_client = NacosHttpStatelessClient(
+		mcp_clients = [
+			NacosHttpStatelessClient(
 					nacos_client_config=self._nacos_client_config,
-					name=mcp_server_name
+					name=mcp_server_dict["mcpServerName"]
 			)
+			for mcp_server_dict in self.mcp_servers
+		]
+		# Fetch every server's detail concurrently, then register in config order
+		await _gather_or_raise(*(client.initialize() for client in mcp_clients))
 
-			await mcp_stateless_client.initialize()
+		for mcp_stateless_client in mcp_clients:
+			mcp_server_name = mcp_stateless_client.name
 			await self.toolkit.register_mcp_client(mcp_stateless_client)
 			self.mcp_server_clients[mcp_server_name] = mcp_stateless_client
 			logger.info(f"[{self.__class__.__name__}] MCP client '{mcp_server_name}' registered")
@@ -536,7 +591,7 @@ class NacosReActAgent(ReActAgent):
 		if not self.nacos_agent_listener.is_initialized():
 			raise RuntimeError("Nacos agent listener is not initialized")
 
-		logger.debug(f"[{self.__class__.__name__}] Initializing NacosReActAgent: {name}")
+		logger.debug("[%s] Initializing NacosReActAgent: %s", self.__class__.__name__, name)
 
 		super().__init__(name=name,
 						 sys_prompt="",
@@ -558,3 +613,26 @@ class NacosReActAgent(ReActAgent):
 		self.nacos_agent_listener.attach_agent(self)
 		logger.info(f"[{self.__class__.__name__}] NacosReActAgent '{name}' created and attached to listener")
 
+	@property
+	def sys_prompt(self) -> str:
+		"""The system prompt, pinned for the duration of a reply.
+
+		A prompt pushed by Nacos while a reply is running takes effect on
+		the next reply instead of switching prompts mid-reasoning.
+		"""
+		prompt = super().sys_prompt
+		pinned = _reply_prompt.get()
+		if pinned is None or pinned[0] is not self:
+			return prompt
+		# Keep whatever the base class appends (e.g. agent skill prompts)
+		if not prompt.startswith(self._sys_prompt):
+			return prompt
+		return pinned[1] + prompt[len(self._sys_prompt):]
+
+	async def __call__(self, *args: Any, **kwargs: Any) -> Msg:
+		"""Run a reply with the current prompt pinned (see `sys_prompt`)."""
+		token = _reply_prompt.set((self, self._sys_prompt))
+		try:
+			return await super().__call__(*args, **kwargs)
+		finally:
+			_reply_prompt.reset(token)
@@ -24,6 +24,7 @@ Environment Variable Configuration:
     NACOS_USERNAME=nacos                          # Optional (Local Nacos)
     NACOS_PASSWORD=nacos                          # Optional (Local Nacos)
     NACOS_LOG_LEVEL=INFO                          # Optional
+    NACOS_POOL_KEEPALIVE=60000                    # Optional (gRPC keepalive, ms)
 """
 import asyncio
 import hashlib
@@ -35,6 +36,7 @@ from typing import Optional
 from v2.nacos import (
     ClientConfig,
     ClientConfigBuilder,
+    GRPCConfig,
     NacosConfigService,
     NacosNamingService,
 )
@@ -55,7 +57,7 @@ class NacosServiceManager:
     Service Pool Structure:
     {
         "config_hash_1": {
-            "config": ClientConfig,
+            "client_config": ClientConfig,
             "naming": NacosNamingService,
             "config": NacosConfigService,
             "ai": NacosAIService,
@@ -158,6 +160,10 @@ class NacosServiceManager:
         log_level = os.getenv("NACOS_LOG_LEVEL", "INFO")
         builder.log_level(log_level)
         
+        keep_alive_ms = os.getenv("NACOS_POOL_KEEPALIVE")
+        if keep_alive_ms:
+            builder.grpc_config(GRPCConfig(max_keep_alive_ms=int(keep_alive_ms)))
+        
         return builder.build()
     
     def _get_global_config(self) -> ClientConfig:
@@ -285,20 +291,62 @@ class NacosServiceManager:
         hash_value = hashlib.md5(hash_string.encode()).hexdigest()[:16]
         
         logger.debug(
-            f"Generated config hash {hash_value} for "
-            f"servers={server_str or endpoint}, namespace={config.namespace_id}"
+            "Generated config hash %s for servers=%s, namespace=%s",
+            hash_value,
+            server_str or endpoint,
+            config.namespace_id,
         )
         
         return hash_value
     
-    def _get_lock(self, config_hash: str) -> asyncio.Lock:
-        """Get lock for config (lazy creation)"""
-        if config_hash not in self._service_locks:
-            self._service_locks[config_hash] = asyncio.Lock()
-        return self._service_locks[config_hash]
+    def _get_lock(self, lock_key: str) -> asyncio.Lock:
+        """Get lock for a pool entry (lazy creation)"""
+        if lock_key not in self._service_locks:
+            self._service_locks[lock_key] = asyncio.Lock()
+        return self._service_locks[lock_key]
     
     # ==================== Service Retrieval ====================
     
+    async def _get_or_create_service(
+        self,
+        client_config: Optional[ClientConfig],
+        service_type: str,
+        factory,
+    ):
+        """Get a pooled service, creating it on first use.
+        
+        The Nacos SDK gives every service instance its own gRPC connection,
+        so the pool keeps exactly one instance per (config, service type).
+        Each service type has its own lock, which lets naming, config and
+        AI services for the same config be created concurrently.
+        
+        Args:
+            client_config: Optional custom config, uses global config if None
+            service_type: Pool key of the service ("naming", "config", "ai")
+            factory: Async factory taking a ClientConfig
+        """
+        config = client_config if client_config else self._get_global_config()
+        config_hash = self._get_config_hash(config)
+        
+        service_group = self._service_pool.get(config_hash)
+        if service_group is None:
+            service_group = self._service_pool.setdefault(
+                config_hash, {"client_config": config}
+            )
+            logger.info(f"Created service group for config hash: {config_hash}")
+        
+        service = service_group.get(service_type)
+        if service is None:
+            async with self._get_lock(f"{config_hash}:{service_type}"):
+                service = service_group.get(service_type)
+                if service is None:
+                    logger.info(f"Creating {service_type} service for hash: {config_hash}")
+                    service = await factory(config)
+                    service_group[service_type] = service
+                    logger.info(f"{service_type} service created for hash: {config_hash}")
+        
+        return service
+    
     async def get_naming_service(
         self,
         client_config: Optional[ClientConfig] = None,
@@ -311,27 +359,9 @@ class NacosServiceManager:
         Returns:
             NacosNamingService: Naming service instance (reuses existing connection)
         """
-        # 1. Determine which config to use
-        config = client_config if client_config else self._get_global_config()
-        config_hash = self._get_config_hash(config)
-        
-        # 2. Check if service pool already has this config group
-        if config_hash not in self._service_pool:
-            async with self._get_lock(config_hash):
-                if config_hash not in self._service_pool:
-                    self._service_pool[config_hash] = {"config": config}
-                    logger.info(f"Created service group for config hash: {config_hash}")
-        
-        # 3. Check if this config group has naming service
-        service_group = self._service_pool[config_hash]
-        if "naming" not in service_group:
-            async with self._get_lock(config_hash):
-                if "naming" not in service_group:
-                    logger.info(f"Creating NacosNamingService for hash: {config_hash}")
-                    service_group["naming"] = await NacosNamingService.create_naming_service(config)
-                    logger.info(f"NacosNamingService created for hash: {config_hash}")
-        
-        return service_group["naming"]
+        return await self._get_or_create_service(
+            client_config, "naming", NacosNamingService.create_naming_service
+        )
     
     async def get_config_service(
         self,
@@ -345,24 +375,9 @@ class NacosServiceManager:
         Returns:
             NacosConfigService: Config service instance (reuses existing connection)
         """
-        config = client_config if client_config else self._get_global_config()
-        config_hash = self._get_config_hash(config)
-        
-        if config_hash not in self._service_pool:
-            async with self._get_lock(config_hash):
-                if config_hash not in self._service_pool:
-                    self._service_pool[config_hash] = {}
-                    logger.info(f"Created service group for config hash: {config_hash}")
-        
-        service_group = self._service_pool[config_hash]
-        if "config" not in service_group:
-            async with self._get_lock(config_hash):
-                if "config" not in service_group:
-                    logger.info(f"Creating NacosConfigService for hash: {config_hash}")
-                    service_group["config"] = await NacosConfigService.create_config_service(config)
-                    logger.info(f"NacosConfigService created for hash: {config_hash}")
-        
-        return service_group["config"]
+        return await self._get_or_create_service(
+            client_config, "config", NacosConfigService.create_config_service
+        )
     
     async def get_ai_service(
         self,
@@ -376,24 +391,9 @@ class NacosServiceManager:
         Returns:
             NacosAIService: AI service instance (reuses existing connection)
         """
-        config = client_config if client_config else self._get_global_config()
-        config_hash = self._get_config_hash(config)
-        
-        if config_hash not in self._service_pool:
-            async with self._get_lock(config_hash):
-                if config_hash not in self._service_pool:
-                    self._service_pool[config_hash] = {"config": config}
-                    logger.info(f"Created service group for config hash: {config_hash}")
-        
-        service_group = self._service_pool[config_hash]
-        if "ai" not in service_group:
-            async with self._get_lock(config_hash):
-                if "ai" not in service_group:
-                    logger.info(f"Creating NacosAIService for hash: {config_hash}")
-                    service_group["ai"] = await NacosAIService.create_ai_service(config)
-                    logger.info(f"NacosAIService created for hash: {config_hash}")
-        
-        return service_group["ai"]
+        return await self._get_or_create_service(
+            client_config, "ai", NacosAIService.create_ai_service
+        )
     
     # ==================== Statistics and Management ====================
     
@@ -422,13 +422,13 @@ class NacosServiceManager:
         total_services = 0
         
         for config_hash, service_group in manager._service_pool.items():
-            config = service_group.get("config")
-            services = [k for k in service_group.keys() if k != "config"]
+            config = service_group.get("client_config")
+            services = [k for k in service_group.keys() if k != "client_config"]
             total_services += len(services)
             
             configs_info.append({
                 "hash": config_hash,
-                "server": config.server_address if config else "unknown",
+                "server": ",".join(config.server_list) if config else "unknown",
                 "namespace": config.namespace_id if config else "unknown",
                 "services": services,
             })
@@ -1,9 +1,13 @@
 import asyncio
+import functools
 import logging
 import random
 import re
 import socket
+import threading
+from collections import deque
 from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import psutil
 from v2.nacos.ai.model.mcp.mcp import McpEndpointInfo, McpServerDetailInfo
@@ -11,22 +15,36 @@ from v2.nacos.ai.model.mcp.mcp import McpEndpointInfo, McpServerDetailInfo
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-def get_first_non_loopback_ip():
-	"""Get the first non-loopback IPv4 address from network interfaces.
-	
-	Returns:
-		str | None: The first non-loopback IP address, or None if not found
-	"""
+@functools.lru_cache(maxsize=1)
+def _scan_first_non_loopback_ip() -> str | None:
 	for interface, addrs in psutil.net_if_addrs().items():
 		for addr in addrs:
 			if addr.family == socket.AF_INET and not addr.address.startswith(
 					'127.'):
-				logger.debug(f"Found non-loopback IP: {addr.address} on interface {interface}")
+				logger.debug("Found non-loopback IP: %s on interface %s", addr.address, interface)
 				return addr.address
-	logger.warning("No non-loopback IP address found")
 	return None
 
-def generate_url_from_endpoint(endpoint: McpEndpointInfo):
+def get_first_non_loopback_ip() -> str | None:
+	"""Get the first non-loopback IPv4 address from network interfaces.
+	
+	The interface scan runs once per process; a miss is not cached so the
+	address is picked up once the network comes up.
+	
+	Returns:
+		str | None: The first non-loopback IP address, or None if not found
+	"""
+	ip = _scan_first_non_loopback_ip()
+	if ip is None:
+		_invalidate_ip_cache()
+		logger.warning("No non-loopback IP address found")
+	return ip
+
+def _invalidate_ip_cache() -> None:
+	"""Forget the cached address so the next call rescans the interfaces."""
+	_scan_first_non_loopback_ip.cache_clear()
+
+def generate_url_from_endpoint(endpoint: McpEndpointInfo) -> str:
 	"""Generate URL from MCP endpoint information.
 	
 	Args:
@@ -36,17 +54,14 @@ def generate_url_from_endpoint(endpoint: McpEndpointInfo):
 		str: Generated URL string
 	"""
 	protocol = endpoint.protocol
-	if endpoint.protocol is None or len(endpoint.protocol) == 0:
-		if endpoint.port == 443:
-			protocol = "https"
-		else:
-			protocol = "http"
+	if not protocol:
+		protocol = "https" if endpoint.port == 443 else "http"
 	url = f"{protocol}://{endpoint.address}:{endpoint.port}{endpoint.path}"
-	logger.debug(f"Generated URL from endpoint: {url}")
+	logger.debug("Generated URL from endpoint: %s", url)
 	return url
 
 
-def random_generate_url_from_mcp_server_detail_info(mcp_server_detail_info: McpServerDetailInfo):
+def random_generate_url_from_mcp_server_detail_info(mcp_server_detail_info: McpServerDetailInfo) -> str:
 	"""Randomly select an endpoint from MCP server details and generate URL.
 	
 	Args:
@@ -58,9 +73,12 @@ def random_generate_url_from_mcp_server_detail_info(mcp_server_detail_info: McpS
 	selected_endpoint = random.choice(
 			mcp_server_detail_info.backendEndpoints)
 	url = generate_url_from_endpoint(selected_endpoint)
-	logger.debug(f"Randomly selected endpoint URL: {url}")
+	logger.debug("Randomly selected endpoint URL: %s", url)
 	return url
 
+# Letters, digits, '.', ':', '_' and '-'
+_AGENT_NAME_RE = re.compile(r'[a-zA-Z0-9._:-]+', re.ASCII)
+
 def validate_agent_name(agent_name: str) -> str:
 	"""Validate and process agent name.
 	
@@ -87,7 +105,7 @@ def validate_agent_name(agent_name: str) -> str:
 	original_name = agent_name
 	agent_name = agent_name.replace(' ', '_')
 	if original_name != agent_name:
-		logger.debug(f"Agent name spaces replaced: '{original_name}' -> '{agent_name}'")
+		logger.debug("Agent name spaces replaced: '%s' -> '%s'", original_name, agent_name)
 
 	# Check length
 	if len(agent_name) > 128:
@@ -95,11 +113,11 @@ def validate_agent_name(agent_name: str) -> str:
 		raise ValueError("Agent name cannot exceed 128 characters")
 
 	# Check if characters conform to standards: letters, digits, '.', ':', '_', '-'
-	if not re.match(r'^[a-zA-Z0-9._:-]+$', agent_name):
+	if _AGENT_NAME_RE.fullmatch(agent_name) is None:
 		logger.error(f"Agent name validation failed: invalid characters in '{agent_name}'")
 		raise ValueError("Agent name can only contain letters, digits, '.', ':', '_', and '-'")
 
-	logger.debug(f"Agent name validated successfully: {agent_name}")
+	logger.debug("Agent name validated successfully: %s", agent_name)
 	return agent_name
 
 
@@ -111,6 +129,16 @@ class AsyncRWLock:
 	- Only one writer can acquire the lock at a time
 	- Writers have exclusive access (no readers or writers)
 	
+	Uncontended acquisitions take a fast path that only touches a
+	non-blocking ``threading.Lock`` and a reader counter, no future is
+	allocated. Contended callers are queued in FIFO order and woken
+	directly by the releasing side.
+	
+	Deprecated:
+		Kept for backward compatibility only; the package no longer uses
+		it. For write-rare state, swap in a new object under an
+		``asyncio.Lock`` and let readers use the reference lock-free.
+	
 	Example:
 		```python
 		rwlock = AsyncRWLock()
@@ -125,62 +153,133 @@ class AsyncRWLock:
 		```
 	"""
 
-	def __init__(self):
-		self._readers = 0
-		self._writers = 0
-		self._lock = asyncio.Lock()
-		self._reader_condition = asyncio.Condition(self._lock)
-		self._writer_condition = asyncio.Condition(self._lock)
-		logger.debug(f"[{self.__class__.__name__}] Initialized")
+	def __init__(self) -> None:
+		self._readers: int = 0
+		# Held for the whole time a writer owns the lock
+		self._writer_lock: threading.Lock = threading.Lock()
+		# Queued (is_writer, future) pairs waiting for the lock
+		self._waiters: deque[tuple[bool, asyncio.Future]] = deque()
+		# Set by the writer that holds the lock while readers drain
+		self._drained: asyncio.Future | None = None
 
-	async def acquire_read(self):
+	async def acquire_read(self) -> None:
 		"""Acquire read lock (async).
 		
-		Waits if any writer holds the lock.
+		Waits if any writer holds or is waiting for the lock.
 		Multiple readers can hold the lock simultaneously.
 		"""
-		async with self._lock:
-			while self._writers > 0:
-				await self._reader_condition.wait()
+		if not self._waiters and self._writer_lock.acquire(blocking=False):
+			# Fast path: no writer around, readers only touch the counter
 			self._readers += 1
-			logger.debug(f"[{self.__class__.__name__}] Read lock acquired (readers: {self._readers})")
+			self._writer_lock.release()
+			return
+
+		waiter = (False, asyncio.get_running_loop().create_future())
+		self._waiters.append(waiter)
+		try:
+			await waiter[1]
+		except asyncio.CancelledError:
+			if waiter[1].done() and not waiter[1].cancelled():
+				# Lock was granted just before cancellation, hand it back
+				self._release_read()
+			else:
+				self._discard_waiter(waiter)
+			raise
 
-	async def release_read(self):
+	async def release_read(self) -> None:
 		"""Release read lock (async).
 		
-		Notifies waiting writers when last reader releases.
+		Wakes a waiting writer when the last reader releases.
 		"""
-		async with self._lock:
-			self._readers -= 1
-			logger.debug(f"[{self.__class__.__name__}] Read lock released (readers: {self._readers})")
-			if self._readers == 0:
-				self._writer_condition.notify_all()
+		self._release_read()
 
-	async def acquire_write(self):
+	async def acquire_write(self) -> None:
 		"""Acquire write lock (async).
 		
 		Waits until no readers or writers hold the lock.
 		Only one writer can hold the lock at a time.
 		"""
-		async with self._lock:
-			while self._readers > 0 or self._writers > 0:
-				await self._writer_condition.wait()
-			self._writers += 1
-			logger.debug(f"[{self.__class__.__name__}] Write lock acquired")
+		if not self._waiters and self._writer_lock.acquire(blocking=False):
+			if self._readers == 0:
+				return
+			# Block new readers and wait for the active ones to drain
+			self._drained = asyncio.get_running_loop().create_future()
+			try:
+				await self._drained
+			except asyncio.CancelledError:
+				self._release_write()
+				raise
+			finally:
+				self._drained = None
+			return
+
+		waiter = (True, asyncio.get_running_loop().create_future())
+		self._waiters.append(waiter)
+		try:
+			# The releasing side transfers the writer lock to us
+			await waiter[1]
+		except asyncio.CancelledError:
+			if waiter[1].done() and not waiter[1].cancelled():
+				self._release_write()
+			else:
+				self._discard_waiter(waiter)
+			raise
 
-	async def release_write(self):
+	async def release_write(self) -> None:
 		"""Release write lock (async).
 		
-		Notifies all waiting readers and writers.
+		Hands the lock to the next queued writer or wakes queued readers.
 		"""
-		async with self._lock:
-			self._writers -= 1
-			logger.debug(f"[{self.__class__.__name__}] Write lock released")
-			self._reader_condition.notify_all()
-			self._writer_condition.notify_all()
+		self._release_write()
+
+	def _discard_waiter(self, waiter: tuple[bool, asyncio.Future]) -> None:
+		"""Drop a cancelled waiter and let the ones queued behind it in."""
+		try:
+			self._waiters.remove(waiter)
+		except ValueError:
+			# A release already skipped and dropped the cancelled future
+			pass
+		self._wake_waiters()
+
+	def _release_read(self) -> None:
+		self._readers -= 1
+		if self._readers == 0:
+			if self._drained is not None and not self._drained.done():
+				self._drained.set_result(None)
+			else:
+				self._wake_waiters()
+
+	def _release_write(self) -> None:
+		self._writer_lock.release()
+		self._wake_waiters()
+
+	def _wake_waiters(self) -> None:
+		"""Grant the lock to queued waiters in FIFO order.
+
+		A writer at the head of the queue gets the writer lock once all
+		readers are gone; consecutive readers at the head are all admitted
+		together.
+		"""
+		while self._waiters:
+			is_writer, future = self._waiters[0]
+			if future.done():
+				self._waiters.popleft()
+				continue
+			if is_writer:
+				if self._readers or not self._writer_lock.acquire(blocking=False):
+					return
+				self._waiters.popleft()
+				future.set_result(None)
+				return
+			if not self._writer_lock.acquire(blocking=False):
+				return
+			self._writer_lock.release()
+			self._waiters.popleft()
+			self._readers += 1
+			future.set_result(None)
 
 	@asynccontextmanager
-	async def read_lock(self):
+	async def read_lock(self) -> AsyncIterator[None]:
 		"""Read lock context manager.
 		
 		Usage:
@@ -192,10 +291,10 @@ class AsyncRWLock:
 		try:
 			yield
 		finally:
-			await self.release_read()
+			self._release_read()
 
 	@asynccontextmanager
-	async def write_lock(self):
+	async def write_lock(self) -> AsyncIterator[None]:
 		"""Write lock context manager.
 		
 		Usage:
@@ -207,4 +306,4 @@ class AsyncRWLock:
 		try:
 			yield
 		finally:
-			await self.release_write()
\ No newline at end of file
+			self._release_write()
@@ -50,6 +50,10 @@ setup(
         "httpx>=0.25.0",
         "pydantic>=2.0.0",
     ],
+    extras_require={
+        # Faster agent card parsing
+        "speedups": ["orjson>=3.9.0"],
+    },
     include_package_data=True,
     zip_safe=False,
 )
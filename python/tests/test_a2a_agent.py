@@ -0,0 +1,66 @@
+"""
+Test module for A2aAgent
+"""
+
+import unittest
+
+from a2a.types import AgentCard
+
+from agentscope_extension_nacos.a2a.a2a_agent import A2aAgent, A2aAgentConfig
+from agentscope_extension_nacos.a2a.a2a_card_resolver import (
+    AgentCardResolverBase,
+)
+
+CARD = AgentCard.model_validate({
+    "name": "RemoteAgent",
+    "url": "http://localhost:8000",
+    "description": "A remote A2A agent",
+    "version": "1.0.0",
+    "capabilities": {},
+    "default_input_modes": ["text/plain"],
+    "default_output_modes": ["text/plain"],
+    "skills": [],
+})
+
+
+class CountingResolver(AgentCardResolverBase):
+    """Resolver that counts how often the card is resolved"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_agent_card(self):
+        self.calls += 1
+        return CARD
+
+
+class TestA2aAgentCard(unittest.IsolatedAsyncioTestCase):
+    """Test cases for resolving the agent card of an A2aAgent"""
+
+    async def test_first_reply_reuses_card_resolved_on_setup(self):
+        resolver = CountingResolver()
+        agent = A2aAgent(
+            "remote",
+            agent_card=resolver,
+            agent_config=A2aAgentConfig(agent_card_ttl=60),
+        )
+
+        await agent._ensure_ready()
+        card = await agent._get_agent_card()
+
+        self.assertIs(card, CARD)
+        self.assertEqual(resolver.calls, 1)
+
+    async def test_zero_ttl_resolves_on_every_reply(self):
+        resolver = CountingResolver()
+        agent = A2aAgent("remote", agent_card=resolver)
+
+        await agent._ensure_ready()
+        await agent._get_agent_card()
+        await agent._get_agent_card()
+
+        self.assertEqual(resolver.calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
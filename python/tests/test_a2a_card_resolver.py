@@ -0,0 +1,318 @@
+"""
+Test module for the A2A agent card resolvers
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+import httpx
+
+from agentscope_extension_nacos.a2a import a2a_card_resolver
+from agentscope_extension_nacos.a2a.a2a_card_resolver import (
+    DefaultA2ACardResolver,
+    FileAgentCardResolver,
+    WellKnownAgentCardResolver,
+)
+
+CARD_DATA = {
+    "name": "RemoteAgent",
+    "url": "http://localhost:8000",
+    "description": "A remote A2A agent",
+    "version": "1.0.0",
+    "capabilities": {},
+    "default_input_modes": ["text/plain"],
+    "default_output_modes": ["text/plain"],
+    "skills": [],
+}
+
+
+class TestDefaultA2ACardResolverCache(unittest.TestCase):
+    """Test cases for the shared card cache of DefaultA2ACardResolver"""
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False
+        ) as f:
+            json.dump(CARD_DATA, f)
+        self.card_path = f.name
+        self.addCleanup(os.unlink, self.card_path)
+        self.addCleanup(
+            a2a_card_resolver._card_cache.pop, (self.card_path, None), None
+        )
+
+    def test_concurrent_misses_across_event_loops(self):
+        """Concurrent misses in a later event loop must not reuse a lock
+        bound to an earlier loop"""
+
+        async def resolve_concurrently():
+            resolvers = [
+                DefaultA2ACardResolver(self.card_path) for _ in range(5)
+            ]
+            results = await asyncio.gather(
+                *(resolver.get_agent_card() for resolver in resolvers),
+                return_exceptions=True,
+            )
+            locks = a2a_card_resolver._card_locks.get(
+                asyncio.get_running_loop()
+            )
+            return results, locks
+
+        with mock.patch.object(a2a_card_resolver, "_CARD_CACHE_TTL", 0.01):
+            for _ in range(3):
+                results, locks = asyncio.run(resolve_concurrently())
+                for result in results:
+                    self.assertNotIsInstance(result, BaseException)
+                    self.assertEqual(result.name, "RemoteAgent")
+                # The lock is dropped once its fetch finished
+                self.assertEqual(locks, {})
+                # Let the cached card expire so the next loop misses
+                time.sleep(0.02)
+
+    def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent misses for one source fetch the card only once"""
+        resolvers = [
+            DefaultA2ACardResolver(self.card_path) for _ in range(5)
+        ]
+        fetches = 0
+        original = FileAgentCardResolver.get_agent_card
+
+        async def counting_get_agent_card(resolver):
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.01)
+            return await original(resolver)
+
+        async def resolve_concurrently():
+            return await asyncio.gather(
+                *(resolver.get_agent_card() for resolver in resolvers),
+            )
+
+        with mock.patch.object(
+            a2a_card_resolver, "_CARD_CACHE_TTL", 60.0
+        ), mock.patch.object(
+            FileAgentCardResolver, "get_agent_card", counting_get_agent_card
+        ):
+            cards = asyncio.run(resolve_concurrently())
+
+        self.assertEqual(fetches, 1)
+        self.assertTrue(all(card is cards[0] for card in cards))
+
+    def write_cards(self, count):
+        """Write ``count`` agent card files and return their paths"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        paths = []
+        for i in range(count):
+            path = os.path.join(tmp_dir.name, f"card{i}.json")
+            with open(path, "w") as f:
+                json.dump({**CARD_DATA, "name": f"Agent{i}"}, f)
+            paths.append(path)
+        return paths
+
+    def test_cache_evicts_oldest_cards_beyond_max_size(self):
+        paths = self.write_cards(3)
+
+        async def resolve_all():
+            for path in paths:
+                await DefaultA2ACardResolver(path).get_agent_card()
+
+        with mock.patch.object(
+            a2a_card_resolver, "_card_cache", OrderedDict()
+        ) as cache, mock.patch.object(
+            a2a_card_resolver, "_CARD_CACHE_MAX_SIZE", 2
+        ):
+            asyncio.run(resolve_all())
+
+        self.assertEqual(list(cache), [(paths[1], None), (paths[2], None)])
+
+    def test_cache_evicts_expired_cards(self):
+        paths = self.write_cards(2)
+
+        async def resolve(path):
+            return await DefaultA2ACardResolver(path).get_agent_card()
+
+        with mock.patch.object(
+            a2a_card_resolver, "_card_cache", OrderedDict()
+        ) as cache, mock.patch.object(
+            a2a_card_resolver, "_CARD_CACHE_TTL", 0.01
+        ):
+            asyncio.run(resolve(paths[0]))
+            time.sleep(0.02)
+            # Storing another card drops the expired one
+            asyncio.run(resolve(paths[1]))
+            self.assertEqual(list(cache), [(paths[1], None)])
+
+            # A miss on an expired card drops it too
+            time.sleep(0.02)
+            self.assertIsNone(
+                a2a_card_resolver._get_cached_card((paths[1], None))
+            )
+            self.assertEqual(list(cache), [])
+
+    def test_cache_is_keyed_by_http_client(self):
+        """A card fetched through one client is not served to another"""
+
+        def create_client(name):
+            def handler(request):
+                return httpx.Response(200, json={**CARD_DATA, "name": name})
+
+            return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def resolve_with_clients():
+            clients = [create_client("First"), create_client("Second")]
+            try:
+                return [
+                    await DefaultA2ACardResolver(
+                        "http://agent.example:8000", httpx_client=client
+                    ).get_agent_card()
+                    for client in clients
+                ]
+            finally:
+                for client in clients:
+                    await client.aclose()
+
+        with mock.patch.object(
+            a2a_card_resolver, "_card_cache", OrderedDict()
+        ) as cache:
+            cards = asyncio.run(resolve_with_clients())
+
+        self.assertEqual([card.name for card in cards], ["First", "Second"])
+        self.assertEqual(len(cache), 2)
+
+
+class TestWellKnownAgentCardResolver(unittest.IsolatedAsyncioTestCase):
+    """Test cases for WellKnownAgentCardResolver"""
+
+    def setUp(self):
+        self.requests = []
+        self.responses = []
+
+    def handler(self, request):
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+    def create_resolver(self, base_url="http://agent.example:8000", **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        self.addAsyncCleanup(client.aclose)
+        return WellKnownAgentCardResolver(
+            base_url, httpx_client=client, **kwargs
+        )
+
+    async def test_not_modified_returns_cached_card(self):
+        self.responses = [
+            httpx.Response(200, json=CARD_DATA, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+        resolver = self.create_resolver()
+
+        first = await resolver.get_agent_card()
+        second = await resolver.get_agent_card()
+
+        self.assertEqual(first.name, "RemoteAgent")
+        self.assertIs(second, first)
+
+    async def test_validators_sent_only_once_a_card_is_cached(self):
+        self.responses = [
+            httpx.Response(
+                200,
+                json=CARD_DATA,
+                headers={
+                    "ETag": '"v1"',
+                    "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                },
+            ),
+            httpx.Response(304),
+        ]
+        resolver = self.create_resolver()
+
+        await resolver.get_agent_card()
+        await resolver.get_agent_card()
+
+        first_request, second_request = self.requests
+        self.assertNotIn("If-None-Match", first_request.headers)
+        self.assertNotIn("If-Modified-Since", first_request.headers)
+        self.assertEqual(second_request.headers["If-None-Match"], '"v1"')
+        self.assertEqual(
+            second_request.headers["If-Modified-Since"],
+            "Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+
+    async def test_changed_card_replaces_cached_card(self):
+        changed = {**CARD_DATA, "version": "2.0.0"}
+        self.responses = [
+            httpx.Response(200, json=CARD_DATA, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json=changed),
+            httpx.Response(200, json=changed),
+        ]
+        resolver = self.create_resolver()
+
+        await resolver.get_agent_card()
+        card = await resolver.get_agent_card()
+        await resolver.get_agent_card()
+
+        self.assertEqual(card.version, "2.0.0")
+        # The second response carried no validators, so none are sent
+        self.assertNotIn("If-None-Match", self.requests[2].headers)
+
+    async def test_not_modified_without_cached_card_raises(self):
+        self.responses = [httpx.Response(304)]
+        resolver = self.create_resolver()
+
+        with mock.patch.object(a2a_card_resolver.logger, "error"):
+            with self.assertRaises(RuntimeError):
+                await resolver.get_agent_card()
+
+    async def test_card_url_without_path_uses_well_known_path(self):
+        self.responses = [httpx.Response(200, json=CARD_DATA)]
+        resolver = self.create_resolver("http://agent.example:8000")
+
+        await resolver.get_agent_card()
+
+        self.assertEqual(
+            str(self.requests[0].url),
+            "http://agent.example:8000/.well-known/agent-card.json",
+        )
+
+    async def test_card_url_without_path_uses_agent_card_path(self):
+        self.responses = [httpx.Response(200, json=CARD_DATA)]
+        resolver = self.create_resolver(
+            "http://agent.example:8000", agent_card_path="/cards/agent.json"
+        )
+
+        await resolver.get_agent_card()
+
+        self.assertEqual(
+            str(self.requests[0].url),
+            "http://agent.example:8000/cards/agent.json",
+        )
+
+    async def test_card_url_with_path_locates_the_card(self):
+        self.responses = [httpx.Response(200, json=CARD_DATA)]
+        resolver = self.create_resolver(
+            "https://agent.example/agents/remote/card.json"
+        )
+
+        await resolver.get_agent_card()
+
+        self.assertEqual(
+            str(self.requests[0].url),
+            "https://agent.example/agents/remote/card.json",
+        )
+
+    async def test_invalid_base_url_raises(self):
+        resolver = self.create_resolver("not-a-url")
+
+        with mock.patch.object(a2a_card_resolver.logger, "error"):
+            with self.assertRaises(RuntimeError):
+                await resolver.get_agent_card()
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,275 @@
+"""
+Test module for the Nacos MCP clients
+"""
+
+import asyncio
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+import httpx
+from agentscope.tool import Toolkit
+from v2.nacos.ai.model.cache.mcp_server_subscribe_manager import (
+    McpServerSubscribeManager,
+)
+from v2.nacos.ai.model.mcp.mcp import McpServerDetailInfo
+from v2.nacos.ai.nacos_ai_service import NacosAIService
+
+from agentscope_extension_nacos.mcp import agentscope_nacos_mcp
+from agentscope_extension_nacos.mcp.agentscope_nacos_mcp import (
+    NacosHttpStatelessClient,
+    NacosMCPClientBase,
+)
+from agentscope_extension_nacos.nacos_service_manager import (
+    NacosServiceManager,
+)
+
+
+class FakeMCPClient(NacosMCPClientBase):
+    """Minimal concrete client for exercising NacosMCPClientBase"""
+
+    def get_supported_transport(self):
+        return ["mcp-sse"]
+
+    async def _list_tools_impl(self):
+        return []
+
+    def _create_tool_function_impl(self, tool, wrap_tool_result=True):
+        raise NotImplementedError
+
+
+class FakeGrpcClientProxy:
+    """gRPC proxy whose MCP server query fails like an unknown server"""
+
+    def __init__(self, error):
+        self.error = error
+        self.unsubscribed = []
+
+    async def subscribe_mcp_server(self, mcp_name, version):
+        raise self.error
+
+    async def unsubscribe_mcp_server(self, mcp_name, version):
+        self.unsubscribed.append(mcp_name)
+
+
+def create_ai_service(grpc_client_proxy):
+    """Create a NacosAIService with the real subscribe manager and a fake
+    gRPC proxy, without connecting to a server"""
+    ai_service = NacosAIService.__new__(NacosAIService)
+    ai_service.mcp_server_subscribe_manager = McpServerSubscribeManager()
+    ai_service.grpc_client_proxy = grpc_client_proxy
+    return ai_service
+
+
+class TestNacosMCPClientInit(unittest.IsolatedAsyncioTestCase):
+    """Test cases for NacosMCPClientBase lazy initialization"""
+
+    async def test_failed_subscribe_does_not_leak_callbacks(self):
+        """A failing subscription is removed again, also across retries"""
+        proxy = FakeGrpcClientProxy(RuntimeError("mcp server not found"))
+        ai_service = create_ai_service(proxy)
+
+        async def get_ai_service(manager, client_config=None):
+            return ai_service
+
+        client = FakeMCPClient(name="missing-server")
+        with mock.patch.object(
+            NacosServiceManager, "get_ai_service", get_ai_service
+        ), mock.patch.object(agentscope_nacos_mcp.logger, "error"):
+            for _ in range(3):
+                with self.assertRaises(RuntimeError):
+                    await client.initialize()
+
+        self.assertFalse(
+            ai_service.mcp_server_subscribe_manager.is_subscribed(
+                "missing-server", None
+            )
+        )
+        self.assertEqual(proxy.unsubscribed, ["missing-server"] * 3)
+        self.assertFalse(client._initialized)
+
+
+def create_detail_info(tool_enabled):
+    """Server detail info whose tool metadata differs per enabled flag"""
+    return McpServerDetailInfo.model_validate({
+        "name": "server",
+        "frontProtocol": "mcp-sse",
+        "toolSpec": {
+            "tools": [],
+            "toolsMeta": {"tool": {"enabled": tool_enabled}},
+        },
+    })
+
+
+class FakeAIService:
+    """AI service that accepts the subscription and keeps its callback"""
+
+    def __init__(self):
+        self.subscribe_param = None
+
+    async def subscribe_mcp_server(self, param):
+        self.subscribe_param = param
+        return create_detail_info(True)
+
+
+class FakeToolkit:
+    """Weak-referenceable stand-in for a Toolkit"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class TestNacosMCPClientNotify(unittest.IsolatedAsyncioTestCase):
+    """Test cases for toolkit notification on Nacos updates"""
+
+    async def asyncSetUp(self):
+        self.ai_service = FakeAIService()
+
+        async def get_ai_service(manager, client_config=None):
+            return self.ai_service
+
+        with mock.patch.object(
+            NacosServiceManager, "get_ai_service", get_ai_service
+        ):
+            self.client = FakeMCPClient(name="server")
+            await self.client.initialize()
+
+        self.toolkits = [FakeToolkit("a"), FakeToolkit("b")]
+        for toolkit in self.toolkits:
+            self.client._attach_toolkit(toolkit)
+
+        # Toolkit name -> number of completed syncs
+        self.syncs = {"a": 0, "b": 0}
+        self.sync_started = asyncio.Event()
+        self.release_sync = asyncio.Event()
+        self.failing = set()
+
+        async def remove_mcp_clients(toolkit, client_names):
+            self.sync_started.set()
+            await self.release_sync.wait()
+            if toolkit.name in self.failing:
+                raise RuntimeError(f"toolkit {toolkit.name} failed")
+
+        async def register_mcp_client(toolkit, mcp_client):
+            self.syncs[toolkit.name] += 1
+
+        for name, fake in (
+            ("remove_mcp_clients", remove_mcp_clients),
+            ("register_mcp_client", register_mcp_client),
+        ):
+            patcher = mock.patch.object(Toolkit, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def push_update(self, tool_enabled):
+        """Deliver a changed server detail info through the Nacos callback"""
+        await self.ai_service.subscribe_param.subscribe_callback(
+            "id", "namespace", "server", create_detail_info(tool_enabled),
+        )
+
+    async def test_burst_during_sync_runs_exactly_one_more_round(self):
+        await self.push_update(False)
+        await self.sync_started.wait()
+        first_task = self.client._notify_task
+
+        # A burst of updates while the first round is still syncing
+        for i in range(5):
+            await self.push_update(i % 2 == 0)
+        self.assertIs(self.client._notify_task, first_task)
+
+        self.release_sync.set()
+        await first_task
+
+        self.assertEqual(self.syncs, {"a": 2, "b": 2})
+        self.assertFalse(self.client._notify_pending)
+
+    async def test_update_after_sync_starts_a_new_round(self):
+        self.release_sync.set()
+        await self.push_update(False)
+        await self.client._notify_task
+        await self.push_update(True)
+        await self.client._notify_task
+
+        self.assertEqual(self.syncs, {"a": 2, "b": 2})
+
+    async def test_failing_toolkit_does_not_block_others(self):
+        self.failing.add("a")
+        self.release_sync.set()
+
+        with mock.patch.object(agentscope_nacos_mcp.logger, "error") as error:
+            await self.push_update(False)
+            await self.client._notify_task
+
+        self.assertEqual(self.syncs, {"a": 0, "b": 1})
+        error.assert_called_once()
+
+
+class TestNacosHttpStatelessClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the pooled streamable HTTP client"""
+
+    def create_client(self, **kwargs):
+        client = NacosHttpStatelessClient(None, "server", **kwargs)
+        client._initialized = True
+        client.mcp_server_detail_info = McpServerDetailInfo.model_validate({
+            "name": "server",
+            "frontProtocol": "mcp-streamable",
+        })
+        self.addAsyncCleanup(client.shutdown)
+        return client
+
+    def get_client(self, client):
+        with mock.patch.object(
+            agentscope_nacos_mcp,
+            "random_generate_url_from_mcp_server_detail_info",
+            return_value="http://mcp.example/mcp",
+        ), mock.patch.object(
+            agentscope_nacos_mcp, "streamable_http_client"
+        ) as pooled, mock.patch.object(
+            agentscope_nacos_mcp, "streamablehttp_client"
+        ) as unpooled:
+            client.get_client()
+        return pooled, unpooled
+
+    async def test_timedelta_timeouts_are_converted(self):
+        client = self.create_client(
+            timeout=timedelta(seconds=5),
+            sse_read_timeout=timedelta(minutes=1),
+        )
+
+        http_client = client._get_http_client()
+
+        self.assertEqual(http_client.timeout.connect, 5.0)
+        self.assertEqual(http_client.timeout.read, 60.0)
+        self.assertIs(client._get_http_client(), http_client)
+
+    async def test_pooled_client_is_configured_like_the_sdk(self):
+        auth = httpx.BasicAuth("user", "secret")
+        client = self.create_client(headers={"X-Token": "t"}, auth=auth)
+
+        pooled, unpooled = self.get_client(client)
+
+        unpooled.assert_not_called()
+        http_client = pooled.call_args.kwargs["http_client"]
+        self.assertEqual(http_client.headers["X-Token"], "t")
+        self.assertIs(http_client.auth, auth)
+        self.assertFalse(http_client.follow_redirects)
+        self.assertEqual(http_client.timeout.read, 300.0)
+
+    async def test_unforwarded_kwargs_fall_back_to_sdk_client(self):
+        client = self.create_client(httpx_client_factory=httpx.AsyncClient)
+
+        pooled, unpooled = self.get_client(client)
+
+        pooled.assert_not_called()
+        unpooled.assert_called_once_with(
+            headers={},
+            timeout=30,
+            sse_read_timeout=300,
+            httpx_client_factory=httpx.AsyncClient,
+            url="http://mcp.example/mcp",
+        )
+        self.assertIsNone(client._http_client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+"""
+Test module for agentscope_extension_nacos.utils
+"""
+
+import asyncio
+import unittest
+
+from agentscope_extension_nacos.utils import AsyncRWLock
+
+
+async def settle():
+    """Let every ready task run until the loop is idle"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestAsyncRWLock(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncRWLock"""
+
+    def setUp(self):
+        self.lock = AsyncRWLock()
+        self.events = []
+
+    async def hold_read(self, name, release):
+        async with self.lock.read_lock():
+            self.events.append(f"{name} acquired")
+            await release.wait()
+        self.events.append(f"{name} released")
+
+    async def hold_write(self, name, release):
+        async with self.lock.write_lock():
+            self.events.append(f"{name} acquired")
+            await release.wait()
+        self.events.append(f"{name} released")
+
+    def assert_idle(self):
+        """The lock is free and has no waiters left"""
+        self.assertEqual(self.lock._readers, 0)
+        self.assertFalse(self.lock._writer_lock.locked())
+        self.assertEqual(len(self.lock._waiters), 0)
+
+    async def test_readers_share_the_lock(self):
+        release = asyncio.Event()
+        readers = [
+            asyncio.create_task(self.hold_read(f"r{i}", release))
+            for i in range(3)
+        ]
+        await settle()
+        self.assertEqual(self.events, ["r0 acquired", "r1 acquired", "r2 acquired"])
+        release.set()
+        await asyncio.gather(*readers)
+        self.assert_idle()
+
+    async def test_writer_excludes_readers_and_writers(self):
+        release_writer = asyncio.Event()
+        release_others = asyncio.Event()
+        release_others.set()
+        writer = asyncio.create_task(self.hold_write("w0", release_writer))
+        await settle()
+        others = [
+            asyncio.create_task(self.hold_read("r1", release_others)),
+            asyncio.create_task(self.hold_write("w2", release_others)),
+        ]
+        await settle()
+        self.assertEqual(self.events, ["w0 acquired"])
+
+        release_writer.set()
+        await asyncio.gather(writer, *others)
+        self.assertEqual(
+            self.events,
+            [
+                "w0 acquired",
+                "w0 released",
+                "r1 acquired",
+                "r1 released",
+                "w2 acquired",
+                "w2 released",
+            ],
+        )
+        self.assert_idle()
+
+    async def test_readers_exclude_writer(self):
+        release_reader = asyncio.Event()
+        release_writer = asyncio.Event()
+        release_writer.set()
+        reader = asyncio.create_task(self.hold_read("r0", release_reader))
+        await settle()
+        writer = asyncio.create_task(self.hold_write("w1", release_writer))
+        await settle()
+        self.assertEqual(self.events, ["r0 acquired"])
+
+        release_reader.set()
+        await asyncio.gather(reader, writer)
+        self.assertEqual(
+            self.events,
+            ["r0 acquired", "r0 released", "w1 acquired", "w1 released"],
+        )
+        self.assert_idle()
+
+    async def test_waiting_writer_blocks_new_readers(self):
+        release_first = asyncio.Event()
+        release_rest = asyncio.Event()
+        first_reader = asyncio.create_task(self.hold_read("r0", release_first))
+        await settle()
+        writer = asyncio.create_task(self.hold_write("w1", release_rest))
+        await settle()
+        # Arrives while the writer waits for r0, so it must queue behind it
+        late_reader = asyncio.create_task(self.hold_read("r2", release_rest))
+        await settle()
+        self.assertEqual(self.events, ["r0 acquired"])
+
+        release_first.set()
+        await settle()
+        self.assertEqual(
+            self.events, ["r0 acquired", "r0 released", "w1 acquired"]
+        )
+
+        release_rest.set()
+        await asyncio.gather(first_reader, writer, late_reader)
+        self.assertEqual(
+            self.events[3:], ["w1 released", "r2 acquired", "r2 released"]
+        )
+        self.assert_idle()
+
+    async def test_waiters_are_granted_in_fifo_order(self):
+        release_writer = asyncio.Event()
+        release = {name: asyncio.Event() for name in ("r1", "r2", "w3", "r4")}
+        writer = asyncio.create_task(self.hold_write("w0", release_writer))
+        await settle()
+        tasks = [
+            asyncio.create_task(self.hold_read("r1", release["r1"])),
+            asyncio.create_task(self.hold_read("r2", release["r2"])),
+            asyncio.create_task(self.hold_write("w3", release["w3"])),
+            asyncio.create_task(self.hold_read("r4", release["r4"])),
+        ]
+        await settle()
+
+        # Consecutive readers at the head of the queue are admitted together
+        release_writer.set()
+        await settle()
+        self.assertEqual(
+            self.events,
+            ["w0 acquired", "w0 released", "r1 acquired", "r2 acquired"],
+        )
+
+        # The writer queued before r4 goes first once both readers left
+        release["r1"].set()
+        await settle()
+        self.assertNotIn("w3 acquired", self.events)
+        release["r2"].set()
+        await settle()
+        self.assertEqual(self.events[-1], "w3 acquired")
+        self.assertNotIn("r4 acquired", self.events)
+
+        release["w3"].set()
+        release["r4"].set()
+        await asyncio.gather(writer, *tasks)
+        self.assertEqual(
+            self.events[-3:], ["w3 released", "r4 acquired", "r4 released"]
+        )
+        self.assert_idle()
+
+    async def test_cancel_queued_reader_before_grant(self):
+        release = asyncio.Event()
+        writer = asyncio.create_task(self.hold_write("w0", release))
+        await settle()
+        reader = asyncio.create_task(self.lock.acquire_read())
+        other_writer = asyncio.create_task(self.hold_write("w1", release))
+        await settle()
+
+        reader.cancel()
+        await settle()
+        with self.assertRaises(asyncio.CancelledError):
+            await reader
+
+        release.set()
+        await asyncio.gather(writer, other_writer)
+        self.assertEqual(
+            self.events,
+            ["w0 acquired", "w0 released", "w1 acquired", "w1 released"],
+        )
+        self.assert_idle()
+
+    async def test_cancel_queued_waiters_racing_a_release(self):
+        """Waiters cancelled right before the holder releases are skipped,
+        even if the release runs before the cancelled tasks resume"""
+        await self.lock.acquire_write()
+        reader = asyncio.create_task(self.lock.acquire_read())
+        writer = asyncio.create_task(self.lock.acquire_write())
+        await settle()
+
+        reader.cancel()
+        writer.cancel()
+        await self.lock.release_write()
+        await settle()
+
+        for task in (reader, writer):
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self.assert_idle()
+
+    async def test_cancel_reader_after_grant(self):
+        await self.lock.acquire_write()
+        reader = asyncio.create_task(self.lock.acquire_read())
+        await settle()
+
+        # The release grants the read lock, the cancellation arrives before
+        # the reader resumed, so the reader must hand the lock back
+        await self.lock.release_write()
+        self.assertEqual(self.lock._readers, 1)
+        reader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await reader
+        self.assert_idle()
+
+    async def test_cancel_writer_after_grant(self):
+        await self.lock.acquire_read()
+        writer = asyncio.create_task(self.lock.acquire_write())
+        await settle()
+        reader = asyncio.create_task(self.lock.acquire_read())
+        await settle()
+
+        # The last reader leaving hands the lock to the draining writer
+        await self.lock.release_read()
+        writer.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await writer
+
+        # The queued reader gets the lock the cancelled writer gave back
+        await reader
+        self.assertEqual(self.lock._readers, 1)
+        await self.lock.release_read()
+        self.assert_idle()
+
+    async def test_cancel_queued_writer_after_grant(self):
+        await self.lock.acquire_write()
+        writer = asyncio.create_task(self.lock.acquire_write())
+        await settle()
+
+        await self.lock.release_write()
+        self.assertTrue(self.lock._writer_lock.locked())
+        writer.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await writer
+        self.assert_idle()
+
+
+if __name__ == "__main__":
+    unittest.main()